@@ -13,10 +13,18 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 
+try:
+    # Optional JIT compiler for the validation kernel
+    from numba import njit  # type: ignore
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
 try:
     # Optional function used to enrich citations with missing abstracts
     from .parsers import parse_pubmed_search, parse_arxiv_search  # type: ignore
@@ -27,6 +35,72 @@ except Exception:
 logger = logging.getLogger(__name__)
 
 
+def _validation_flags(title_lens: np.ndarray, abs_lens: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """Compute per‑citation validation flags from pre‑extracted columns.
+
+    Returns an ``(n, 3)`` boolean array whose columns flag a short
+    title, a short abstract and a year outside 1900–2100.  Missing
+    years are passed as NaN and are flagged as out of range; callers
+    mask them with the presence of a year value.
+    """
+    out = np.empty((title_lens.size, 3), dtype=np.bool_)
+    out[:, 0] = title_lens < 5
+    out[:, 1] = abs_lens < 50
+    out[:, 2] = ~((years >= 1900) & (years <= 2100))
+    return out
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _validation_flags(title_lens, abs_lens, years):  # type: ignore[no-redef]  # noqa: F811
+        n = title_lens.size
+        out = np.zeros((n, 3), np.bool_)
+        for i in range(n):
+            out[i, 0] = title_lens[i] < 5
+            out[i, 1] = abs_lens[i] < 50
+            y = years[i]
+            out[i, 2] = not (y >= 1900 and y <= 2100)
+        return out
+
+
+# Length of a value once stripped, applied element‑wise to object arrays
+_stripped_len = np.frompyfunc(lambda v: len(v.strip() if isinstance(v, str) else str(v).strip()), 1, 1)
+
+
+def _text_lengths(series: pd.Series) -> np.ndarray:
+    """Return stripped string lengths of a column as an int64 array.
+
+    Missing values count as empty.  Working on the underlying object
+    array avoids building the intermediate Series of the ``.str``
+    accessor chain.
+    """
+    values = series.to_numpy(dtype=object, na_value='')
+    return _stripped_len(values).astype(np.int64)
+
+
+# Placeholder strings that mean "no value" in an ID field
+_NAN_SENTINELS = frozenset({'', 'nan', 'none', 'null'})
+
+
+def _clean_text(value: Any) -> str:
+    """Return a stripped string, treating ``None`` and NaN as empty."""
+    if value is None or (isinstance(value, float) and value != value):
+        return ''
+    return str(value).strip()
+
+
+def _is_blank(value: Any) -> bool:
+    """Return True if an ID value is missing or a placeholder string."""
+    return _clean_text(value).lower() in _NAN_SENTINELS
+
+
+def _title_hash(title: Any) -> Optional[str]:
+    """Return a short BLAKE2b‑based ID for a title, or ``None`` if it is empty."""
+    if not isinstance(title, str) or not title:
+        return None
+    return 'hash_' + hashlib.blake2b(title.encode('utf-8', 'replace'), digest_size=8).hexdigest()
+
+
 class CitationValidator:
     """Validate and enhance a list of citations.
 
@@ -40,7 +114,18 @@ class CitationValidator:
 
     def __init__(self) -> None:
         self.validation_results: List[Dict[str, Any]] = []
-        self.stats: Dict[str, int] = {
+        self.stats: Dict[str, int] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the statistics and problem list before a new set of uploads.
+
+        Counts accumulate across ``validate_citations`` calls so chunked
+        input is reported as a whole; a reused validator must be reset
+        between independent loads.
+        """
+        self.validation_results = []
+        self.stats = {
             'total': 0,
             'valid': 0,
             'missing_abstract': 0,
@@ -53,10 +138,11 @@ class CitationValidator:
     def validate_citations(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """Validate each citation in a DataFrame.
 
-        For each row the validator checks the ID, title, abstract and
-        year fields.  Missing or invalid values are recorded and
-        optionally repaired.  After all rows have been processed a
-        summary report is generated.
+        The ID, title, abstract and year fields are checked as whole
+        columns using vectorised boolean masks rather than row by row.
+        Missing or invalid values are recorded and optionally
+        repaired.  After all rows have been processed a summary report
+        is generated.
 
         Args:
             df: DataFrame of citations to validate.
@@ -64,18 +150,66 @@ class CitationValidator:
         Returns:
             A tuple of (validated DataFrame, report dictionary).
         """
-        self.stats['total'] = len(df)
-        validated_rows: List[Dict[str, Any]] = []
-        for idx, row in df.iterrows():
-            validated_row, issues = self.validate_single_citation(row.to_dict())
-            if issues:
-                self.validation_results.append({
-                    'citation_id': validated_row.get('id', f'row_{idx}'),
-                    'title': validated_row.get('title', 'Unknown')[:50],
-                    'issues': issues,
-                })
-            validated_rows.append(validated_row)
-        validated_df = pd.DataFrame(validated_rows)
+        self.stats['total'] += len(df)
+        validated_df = df.copy()
+        # Checked columns missing from the input are added for the checks
+        # and dropped again afterwards (except generated IDs), so loading
+        # the result does not blank those fields on stored citations
+        added = [col for col in ('id', 'title', 'abstract', 'year', 'doi') if col not in validated_df.columns]
+        for col in added:
+            validated_df[col] = None
+        # Build one boolean mask per check
+        id_s = validated_df['id'].fillna('').astype(str).str.strip()
+        bad_id = id_s.str.lower().isin(_NAN_SENTINELS)
+        year_raw = validated_df['year']
+        year_num = pd.to_numeric(year_raw, errors='coerce')
+        flags = _validation_flags(
+            _text_lengths(validated_df['title']),
+            _text_lengths(validated_df['abstract']),
+            year_num.to_numpy(dtype=np.float64, na_value=np.nan),
+        )
+        bad_title = pd.Series(flags[:, 0], index=validated_df.index)
+        bad_abs = pd.Series(flags[:, 1], index=validated_df.index)
+        year_present = year_raw.notna() & (year_raw.astype(str).str.strip() != '')
+        bad_year = year_present & flags[:, 2]
+        self.stats['invalid_id'] += int(bad_id.sum())
+        self.stats['missing_title'] += int(bad_title.sum())
+        self.stats['missing_abstract'] += int(bad_abs.sum())
+        self.stats['invalid_year'] += int(bad_year.sum())
+        self.stats['valid'] += int((~bad_title & ~bad_abs).sum())
+        # Generate IDs from DOI or title where the ID is missing
+        if bad_id.any():
+            missing = validated_df.loc[bad_id]
+            doi_s = missing['doi'].fillna('').astype(str).str.strip()
+            has_doi = (doi_s != '') & (doi_s.str.lower() != 'nan')
+            hashes = missing['title'].map(_title_hash)
+            fallback = 'unknown_' + missing.index.astype(str)
+            generated = doi_s.where(has_doi, hashes.where(hashes.notna(), pd.Series(fallback, index=missing.index)))
+            validated_df['id'] = validated_df['id'].astype(object)
+            validated_df.loc[bad_id, 'id'] = generated
+        # Record details for the first few problematic citations only
+        mask_any = bad_id | bad_title | bad_abs | bad_year
+        # Positions rather than labels, as the index may repeat (for
+        # example after ``pd.concat`` without ``ignore_index``)
+        for pos in np.flatnonzero(mask_any.to_numpy())[:10]:
+            issues: List[str] = []
+            if bad_id.iat[pos]:
+                issues.append('Missing or invalid ID')
+            if bad_title.iat[pos]:
+                issues.append('Missing or too short title')
+            if bad_abs.iat[pos]:
+                issues.append('Missing or insufficient abstract')
+            if bad_year.iat[pos]:
+                label = 'Invalid year' if pd.notna(year_num.iat[pos]) else 'Invalid year format'
+                issues.append(f'{label}: {year_raw.iat[pos]}')
+            self.validation_results.append({
+                'citation_id': validated_df['id'].iat[pos],
+                'title': _clean_text(validated_df['title'].iat[pos])[:50] or 'Unknown',
+                'issues': issues,
+            })
+        if bad_year.any():
+            validated_df['year'] = year_raw.mask(bad_year)
+        validated_df = validated_df.drop(columns=[col for col in added if col != 'id'])
         # Provide an opportunity to enrich missing abstracts
         initial_missing = self.stats['missing_abstract']
         if initial_missing > 0 and ENRICH_AVAILABLE:
@@ -90,26 +224,18 @@ class CitationValidator:
         """Validate a single citation dictionary."""
         issues: List[str] = []
         # Validate ID
-        citation_id = str(citation.get('id', '')).strip()
-        if not citation_id or citation_id.lower() == 'nan':
+        if _is_blank(citation.get('id')):
             issues.append('Missing or invalid ID')
             self.stats['invalid_id'] += 1
-            # Try to generate an ID from DOI or title
-            doi = citation.get('doi')
-            if doi and str(doi).lower() != 'nan':
-                citation_id = str(doi)
-            else:
-                title = citation.get('title', '') or ''
-                citation_id = f"hash_{hashlib.md5(title.encode()).hexdigest()[:12]}" if title else f"unknown_{self.stats['total']}"
-            citation['id'] = citation_id
+            citation['id'] = self._generate_id(citation.get('doi'), citation.get('title'), self.stats['total'])
         # Validate title
-        title = str(citation.get('title', '')).strip()
-        if not title or len(title) < 5:
+        title_len = len(_clean_text(citation.get('title')))
+        if title_len < 5:
             issues.append('Missing or too short title')
             self.stats['missing_title'] += 1
         # Validate abstract
-        abstract = str(citation.get('abstract', '')).strip()
-        if not abstract or len(abstract) < 50:
+        abstract_len = len(_clean_text(citation.get('abstract')))
+        if abstract_len < 50:
             issues.append('Missing or insufficient abstract')
             self.stats['missing_abstract'] += 1
         # Validate year
@@ -126,10 +252,17 @@ class CitationValidator:
                 self.stats['invalid_year'] += 1
                 citation['year'] = None
         # Count as valid if title and abstract are sufficiently populated
-        if title and len(title) >= 5 and abstract and len(abstract) >= 50:
+        if title_len >= 5 and abstract_len >= 50:
             self.stats['valid'] += 1
         return citation, issues
 
+    @staticmethod
+    def _generate_id(doi: Any, title: Any, fallback: Any) -> str:
+        """Derive a replacement ID from the DOI, else a hash of the title."""
+        if doi and not pd.isna(doi) and str(doi).lower() != 'nan':
+            return str(doi)
+        return _title_hash(title) or f"unknown_{fallback}"
+
     def generate_validation_report(self) -> Dict[str, Any]:
         """Compile a report of validation statistics and recommendations."""
         total = self.stats['total']
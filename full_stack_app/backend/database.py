@@ -20,27 +20,90 @@ from __future__ import annotations
 import json
 import logging
 import os
-from contextlib import contextmanager
-from typing import Any, Dict, List, Optional
+import re
+import uuid
+from contextlib import contextmanager, suppress
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
-from sqlalchemy import Column, DateTime, Integer, String, Text, create_engine, text
+from sqlalchemy import (
+    Column, DateTime, Integer, String, Text, bindparam, case, create_engine, event, func, insert, inspect, select,
+    text, update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 logger = logging.getLogger(__name__)
 
+# Use orjson for the JSON‑encoded columns when it is installed; it is a
+# drop‑in replacement for the stdlib codec on this hot path.
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialise a value to a JSON string."""
+    if HAS_ORJSON:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(value)
+
+
+def _json_loads(value: str) -> Any:
+    """Deserialise a JSON string."""
+    if HAS_ORJSON:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
 # SQLAlchemy base class used to declare models
 Base = declarative_base()
 
+# Per‑connection SQLite settings: WAL lets readers proceed during writes,
+# NORMAL sync skips the per‑commit fsync that WAL makes unnecessary, and
+# the remaining settings keep temp tables, a 256 MB mmap window and a
+# 64 MB page cache in memory.
+_SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+)
+
+# Bumped after every committed bulk load; see ``get_corpus_version``
+_corpus_version = 0
+
+# Default number of rows written per upsert statement in ``bulk_insert_citations``
+_UPSERT_CHUNK_SIZE = 5000
+# Columns overwritten when an incoming citation ID already exists
+_UPSERT_COLUMNS = (
+    'title', 'abstract', 'authors', 'journal', 'doi', 'url', 'mesh_terms', 'keywords', 'raw_data',
+)
+# Staging table name prefix and default chunk size used by
+# ``bulk_insert_citations_fast``; each load stages into its own table.
+# Eleven columns per row keeps a 3000‑row multi‑row INSERT well under
+# PostgreSQL's limit of 65535 bound parameters.
+_STAGE_TABLE = 'citations_stage'
+_STAGE_CHUNK_SIZE = 3000
+
 
 class Citation(Base):
     """ORM model for a single citation entry.
 
     Each citation holds a minimal set of metadata required for the
     screening workflow: an ID, a title, an abstract, a publication
-    year, authors, the journal name, a DOI, optional MeSH terms and
-    keywords as comma‑separated strings, the raw source data in JSON
+    year, authors, the journal name, a DOI, the citation's PubMed,
+    arXiv or DOI URL (computed when the row is written), optional MeSH
+    terms and keywords as JSON arrays, the raw source data in JSON
     form and a timestamp.
     """
 
@@ -49,16 +112,26 @@ class Citation(Base):
     id = Column(String, primary_key=True)
     title = Column(Text, nullable=False)
     abstract = Column(Text, nullable=True)
-    year = Column(Integer, nullable=True)
+    year = Column(Integer, nullable=True, index=True)
     authors = Column(Text, nullable=True)  # JSON list encoded as text
     journal = Column(String, nullable=True)
-    doi = Column(String, nullable=True)
-    mesh_terms = Column(Text, nullable=True)
-    keywords = Column(Text, nullable=True)
+    doi = Column(String, nullable=True, index=True)
+    url = Column(String, nullable=True)
+    mesh_terms = Column(Text, nullable=True)  # JSON list encoded as text
+    keywords = Column(Text, nullable=True)  # JSON list encoded as text
     raw_data = Column(Text, nullable=True)  # JSON encoded string
     created_at = Column(DateTime, nullable=True)
 
 
+class SchemaMigration(Base):
+    """Name of a one‑off data migration that has been applied."""
+
+    __tablename__ = 'schema_migrations'
+
+    name = Column(String, primary_key=True)
+
+
+@lru_cache(maxsize=1)
 def _get_database_url() -> str:
     """Resolve the database URL from environment variables.
 
@@ -80,32 +153,253 @@ def _get_database_url() -> str:
     return f"sqlite:///{default_path}"
 
 
-# Create engine and session factory.  StaticPool is used for SQLite to allow
-# sharing connections across threads when running tests or the UI.
-DATABASE_URL = _get_database_url()
-if DATABASE_URL.startswith('sqlite'):  # special handling for SQLite
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={'check_same_thread': False},
-        poolclass=StaticPool
-    )
-else:
-    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Apply WAL journaling and cache tuning on every new connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
 
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+def _create_engine(url: str) -> Any:
+    """Create the engine for a database URL.
+
+    File‑backed SQLite databases use a regular connection pool so
+    readers can run concurrently under WAL; in‑memory databases exist
+    per connection, so they keep a StaticPool to share a single
+    connection across threads when running tests or the UI.
+    """
+    if not url.startswith('sqlite'):
+        return create_engine(url, pool_pre_ping=True)
+    # special handling for SQLite
+    if make_url(url).database in (None, '', ':memory:'):
+        sqlite_engine = create_engine(
+            url,
+            connect_args={'check_same_thread': False},
+            poolclass=StaticPool
+        )
+    else:
+        sqlite_engine = create_engine(
+            url,
+            connect_args={'check_same_thread': False, 'timeout': 30},
+            pool_size=8,
+            max_overflow=16,
+        )
+    event.listen(sqlite_engine, 'connect', _set_sqlite_pragmas)
+    return sqlite_engine
+
+
+def configure(url: Optional[str] = None) -> None:
+    """Point the module at a database, replacing the current engine.
+
+    ``url`` defaults to the one resolved from the environment.  This is
+    called once at import; call it again (for example with
+    ``'sqlite:///:memory:'`` in tests) to switch databases without
+    reloading the module.  Call ``init_db`` afterwards to create the
+    schema.
+    """
+    global DATABASE_URL, engine, SessionLocal, _fts_ready
+    previous = globals().get('engine')
+    DATABASE_URL = url or _get_database_url()
+    engine = _create_engine(DATABASE_URL)
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    _fts_ready = None
+    if previous is not None:
+        previous.dispose()
+
+
+# Full‑text index over title and abstract.  On SQLite this is an FTS5
+# external‑content table kept in sync with ``citations`` by triggers; on
+# PostgreSQL it is a GIN index over a ``tsvector`` expression.
+_SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS citations_fts USING fts5("
+    "title, abstract, content='citations', content_rowid='rowid', tokenize='porter unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS citations_ai AFTER INSERT ON citations BEGIN "
+    "INSERT INTO citations_fts(rowid, title, abstract) VALUES (new.rowid, new.title, new.abstract); END",
+    "CREATE TRIGGER IF NOT EXISTS citations_ad AFTER DELETE ON citations BEGIN "
+    "INSERT INTO citations_fts(citations_fts, rowid, title, abstract) "
+    "VALUES ('delete', old.rowid, old.title, old.abstract); END",
+    "CREATE TRIGGER IF NOT EXISTS citations_au AFTER UPDATE ON citations BEGIN "
+    "INSERT INTO citations_fts(citations_fts, rowid, title, abstract) "
+    "VALUES ('delete', old.rowid, old.title, old.abstract); "
+    "INSERT INTO citations_fts(rowid, title, abstract) VALUES (new.rowid, new.title, new.abstract); END",
+)
+_PG_TSVECTOR = "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(abstract, ''))"
+# The SQLite search returns an FTS5 ``snippet()`` of up to 32 abstract
+# tokens around the matched terms instead of the whole abstract.
+_SQLITE_FTS_SEARCH = text(
+    "SELECT c.id, c.title, snippet(citations_fts, 1, '', '', '...', 32), c.url FROM citations_fts "
+    "JOIN citations c ON c.rowid = citations_fts.rowid "
+    "WHERE citations_fts MATCH :query ORDER BY bm25(citations_fts) LIMIT :limit"
+)
+_PG_FTS_SEARCH = text(
+    f"SELECT id, title, abstract, url FROM citations "
+    f"WHERE {_PG_TSVECTOR} @@ plainto_tsquery('english', :query) "
+    f"ORDER BY ts_rank({_PG_TSVECTOR}, plainto_tsquery('english', :query)) DESC LIMIT :limit"
+)
+# URL templates keyed on the citation ID prefix (the part before ``:``)
+_ID_URL_TEMPLATES = {
+    'PMID': 'https://pubmed.ncbi.nlm.nih.gov/{}/',
+    'arxiv': 'https://arxiv.org/abs/{}',
+}
+# Columns returned by ``get_all_citations`` when no field list is given
+_LISTING_FIELDS = (
+    'id', 'title', 'abstract', 'year', 'authors', 'journal', 'doi', 'mesh_terms', 'keywords',
+)
+# Columns holding JSON‑encoded lists
+_LIST_FIELDS = frozenset({'authors', 'mesh_terms', 'keywords'})
+# Words kept from a free‑text query when building an FTS5 MATCH expression
+_QUERY_WORD_RE = re.compile(r'\w+')
+# Search snippet computed in SQL: the abstract (else the title) cut to
+# 200 characters, matching ``_snippet``
+_SNIPPET_SOURCE = func.coalesce(func.nullif(Citation.__table__.c.abstract, ''), Citation.__table__.c.title, '')
+_SNIPPET_SQL = case(
+    (func.length(_SNIPPET_SOURCE) > 200, func.substr(_SNIPPET_SOURCE, 1, 200) + '...'),
+    else_=_SNIPPET_SOURCE,
+)
+# Citation lookups used by ``fetch_citation`` and ``fetch_citations_bulk``
+_FETCH_COLUMNS = tuple(Citation.__table__.c[name] for name in _LISTING_FIELDS + ('raw_data',))
+_FETCH_STMT = select(*_FETCH_COLUMNS).where(Citation.__table__.c.id == bindparam('citation_id'))
+_FETCH_BULK_STMT = select(*_FETCH_COLUMNS).where(
+    Citation.__table__.c.id.in_(bindparam('citation_ids', expanding=True))
+)
+# Whether the full‑text index exists; resolved lazily on first search
+_fts_ready: Optional[bool] = None
+
+configure()
 
 
 def init_db() -> None:
     """Initialise the database schema.
 
-    Creates all tables defined on the Base metadata.  If tables
-    already exist this function is a no‑op.  Logging is used to
-    indicate when the schema has been created.
+    Creates all tables and indexes defined on the Base metadata
+    together with the full‑text search index.  If they already exist this function is a
+    no‑op.  Logging is used to indicate when the schema has been
+    created.
     """
+    global _fts_ready
     Base.metadata.create_all(bind=engine)
+    # create_all only builds indexes alongside new tables, so add any
+    # that are missing from a database created by an older version
+    for index in Citation.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+    _migrate_term_columns()
+    _migrate_url_column()
+    try:
+        with engine.begin() as conn:
+            if engine.dialect.name == 'sqlite':
+                existed = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE name = 'citations_fts'")
+                ).first() is not None
+                for statement in _SQLITE_FTS_DDL:
+                    conn.execute(text(statement))
+                if not existed:
+                    # index any rows stored before the FTS table existed
+                    conn.execute(text("INSERT INTO citations_fts(citations_fts) VALUES ('rebuild')"))
+                _fts_ready = True
+            elif engine.dialect.name == 'postgresql':
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_citations_fts ON citations USING gin ({_PG_TSVECTOR})"
+                ))
+                _fts_ready = True
+    except Exception as e:
+        logger.warning(f"Full‑text index unavailable, falling back to LIKE search: {e}")
+        _fts_ready = False
     logger.info("Database initialised (tables created if missing)")
 
 
+# Marker recorded in ``schema_migrations`` once term columns hold JSON
+_TERM_COLUMNS_MIGRATION = 'json_term_columns'
+
+
+def _migrate_term_columns() -> None:
+    """Rewrite legacy ``', '``‑joined MeSH terms and keywords as JSON arrays.
+
+    The table is scanned once per database; afterwards a marker row in
+    ``schema_migrations`` makes this a single primary‑key lookup.
+    """
+    table = SchemaMigration.__table__
+    with engine.begin() as conn:
+        done = conn.execute(
+            select(table.c.name).where(table.c.name == _TERM_COLUMNS_MIGRATION)
+        ).first()
+        if done is not None:
+            return
+        for column in ('mesh_terms', 'keywords'):
+            rows = [
+                (cid, value) for cid, value in conn.execute(text(
+                    f"SELECT id, {column} FROM citations WHERE {column} <> ''"
+                ))
+                if not _is_json_list(value)
+            ]
+            if rows:
+                conn.execute(
+                    text(f"UPDATE citations SET {column} = :value WHERE id = :id"),
+                    [{'id': cid, 'value': _json_dumps(value.split(', '))} for cid, value in rows],
+                )
+                logger.info(f"Migrated {len(rows)} {column} values to JSON arrays")
+        conn.execute(insert(table).values(name=_TERM_COLUMNS_MIGRATION))
+
+
+def _is_json_list(stored: str) -> bool:
+    """Return True if a stored list column holds a JSON array.
+
+    Legacy ``', '``‑joined values may also start with ``[``, for example
+    a keyword such as ``[Review] trials``, so the prefix alone is not
+    enough.
+    """
+    if not stored.startswith('['):
+        return False
+    try:
+        return isinstance(_json_loads(stored), list)
+    except ValueError:  # the JSONDecodeError of either library
+        return False
+
+
+def _migrate_url_column() -> None:
+    """Add and backfill the ``url`` column on a database created without it."""
+    if 'url' in {column['name'] for column in inspect(engine).get_columns('citations')}:
+        return
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE citations ADD COLUMN url VARCHAR"))
+        rows = conn.execute(text("SELECT id, doi FROM citations")).all()
+        updates = [{'id': cid, 'url': _citation_url(cid, doi)} for cid, doi in rows]
+        updates = [values for values in updates if values['url']]
+        if updates:
+            conn.execute(text("UPDATE citations SET url = :url WHERE id = :id"), updates)
+    logger.info(f"Added url column and backfilled {len(updates)} citations")
+
+
+def rebuild_search_index() -> None:
+    """Rebuild the SQLite FTS5 index from the ``citations`` table.
+
+    The FTS5 table is keyed on the implicit ``rowid`` of ``citations``,
+    which SQLite may renumber during ``VACUUM``; run this afterwards.
+    """
+    if engine.dialect.name == 'sqlite':
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO citations_fts(citations_fts) VALUES ('rebuild')"))
+
+
+def _fts_available() -> bool:
+    """Return True if the full‑text index can be used for searches."""
+    global _fts_ready
+    if _fts_ready is None:
+        if engine.dialect.name == 'sqlite':
+            with engine.connect() as conn:
+                _fts_ready = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE name = 'citations_fts'")
+                ).first() is not None
+        else:
+            _fts_ready = engine.dialect.name == 'postgresql'
+    return _fts_ready
+
+
+def _fts_match_query(query: str) -> str:
+    """Quote each word of a free‑text query as an FTS5 string (implicit AND)."""
+    return ' '.join(f'"{word}"' for word in _QUERY_WORD_RE.findall(query))
+
+
 @contextmanager
 def get_db() -> Any:
     """Provide a transactional scope for database operations.
@@ -125,72 +419,314 @@ def get_db() -> Any:
         db.close()
 
 
-def bulk_insert_citations(df: pd.DataFrame) -> Dict[str, int]:
-    """Insert or update a list of citations from a Pandas DataFrame.
+def _is_missing(value: Any) -> bool:
+    """Return True for ``None``, empty strings and NaN scalars."""
+    return value is None or value == '' or (isinstance(value, float) and pd.isna(value))
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Wrap scalar values in a list, mapping missing values to ``[]``."""
+    if isinstance(value, list):
+        return value
+    return [] if _is_missing(value) else [value]
+
 
-    This routine iterates over the rows in ``df`` and inserts a new
-    citation if it does not already exist.  If the ID exists, the
-    existing record is updated.  This behaviour makes repeated
-    invocations idempotent.  The function returns a dictionary with
-    counts of inserted, updated and skipped records.
+def _serialise_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert a citations DataFrame into database‑ready column values.
+
+    Every list and JSON field is serialised once per column with
+    ``Series.map`` rather than inside the per‑row write loop, and
+    missing values are normalised to ``None`` so they bind as ``NULL``.
     """
-    stats = {"inserted": 0, "updated": 0, "skipped": 0, "total": len(df)}
-    for _, row in df.iterrows():
-        citation_id = str(row.get('id', '')).strip()
-        if not citation_id:
-            stats["skipped"] += 1
-            continue
-        with get_db() as session:
-            existing = session.query(Citation).filter(Citation.id == citation_id).first()
-            # prepare serialisable fields
-            authors = row.get('authors') or []
-            if isinstance(authors, list):
-                authors_json = json.dumps(authors)
-            else:
-                authors_json = json.dumps([authors])
-            mesh_terms = row.get('mesh_terms') or []
-            mesh_terms_str = ', '.join(mesh_terms) if isinstance(mesh_terms, list) else str(mesh_terms)
-            keywords = row.get('keywords') or []
-            keywords_str = ', '.join(keywords) if isinstance(keywords, list) else str(keywords)
-            raw_data = row.get('raw_data') or {}
-            raw_data_str = json.dumps(raw_data)
-            if existing:
-                # update fields
-                existing.title = row.get('title', existing.title)
-                existing.abstract = row.get('abstract', existing.abstract)
-                existing.year = row.get('year') or existing.year
-                existing.authors = authors_json
-                existing.journal = row.get('journal', existing.journal)
-                existing.doi = row.get('doi', existing.doi)
-                existing.mesh_terms = mesh_terms_str
-                existing.keywords = keywords_str
-                existing.raw_data = raw_data_str
-                stats["updated"] += 1
-            else:
-                new_citation = Citation(
-                    id=citation_id,
-                    title=row.get('title', ''),
-                    abstract=row.get('abstract', ''),
-                    year=row.get('year'),
-                    authors=authors_json,
-                    journal=row.get('journal', ''),
-                    doi=row.get('doi', ''),
-                    mesh_terms=mesh_terms_str,
-                    keywords=keywords_str,
-                    raw_data=raw_data_str
-                )
-                session.add(new_citation)
-                stats["inserted"] += 1
+    def column(name: str) -> pd.Series:
+        if name in df.columns:
+            return df[name].astype(object)
+        return pd.Series(None, index=df.index, dtype=object)
+
+    def nullable(series: pd.Series) -> pd.Series:
+        return series.where(series.notna(), None)
+
+    year = pd.to_numeric(column('year'), errors='coerce')
+    year = np.trunc(year).astype('Int64').astype(object)
+    ids = column('id').fillna('').astype(str).str.strip()
+    doi = nullable(column('doi'))
+    return pd.DataFrame({
+        'id': ids,
+        'title': column('title').fillna(''),
+        'abstract': nullable(column('abstract')),
+        'year': nullable(year),
+        'authors': column('authors').map(lambda v: _json_dumps(_as_list(v))),
+        'journal': nullable(column('journal')),
+        'doi': doi,
+        'url': _citation_urls(ids, doi),
+        'mesh_terms': column('mesh_terms').map(lambda v: _json_dumps(_as_list(v))),
+        'keywords': column('keywords').map(lambda v: _json_dumps(_as_list(v))),
+        'raw_data': column('raw_data').map(lambda v: _json_dumps({} if _is_missing(v) else v)),
+    }, index=df.index)
+
+
+def _updated_columns(df: pd.DataFrame) -> Tuple[str, ...]:
+    """Return the upsert columns an input frame provides values for.
+
+    Columns missing from the frame keep their stored values when an
+    existing citation is updated.  The URL is derived from the ID and
+    the DOI, so it is refreshed only when the DOI is supplied.
+    """
+    return tuple(
+        col for col in _UPSERT_COLUMNS
+        if col in df.columns or (col == 'url' and 'doi' in df.columns)
+    )
+
+
+def _upsert_statement(columns: Sequence[str]) -> Any:
+    """Build an ``INSERT ... ON CONFLICT DO UPDATE`` for the active dialect.
+
+    Only ``columns`` are overwritten on conflict.  Returns ``None`` when
+    the database dialect has no native upsert support, in which case
+    callers fall back to a bulk INSERT/UPDATE.  An incoming ``NULL``
+    year never overwrites a known year.
+    """
+    table = Citation.__table__
+    if engine.dialect.name == 'sqlite':
+        stmt = sqlite_insert(table)
+    elif engine.dialect.name == 'postgresql':
+        stmt = postgresql_insert(table)
+    else:
+        return None
+    updates = {col: stmt.excluded[col] for col in columns}
+    updates['year'] = func.coalesce(stmt.excluded.year, table.c.year)
+    return stmt.on_conflict_do_update(index_elements=['id'], set_=updates)
+
+
+def _write_citation_batch(
+    session: Any,
+    batch: Dict[str, Dict[str, Any]],
+    columns: Sequence[str],
+    stats: Dict[str, int],
+) -> None:
+    """Upsert one batch of serialised citations keyed by ID.
+
+    Existing citations are updated only in ``columns`` (and the year).
+    """
+    existing = set(session.scalars(select(Citation.id).where(Citation.id.in_(list(batch)))))
+    stats["updated"] += len(existing)
+    stats["inserted"] += len(batch) - len(existing)
+    stmt = _upsert_statement(columns)
+    if stmt is not None:
+        session.execute(stmt, list(batch.values()))
+        return
+    # Without a native upsert, split the batch into one executemany
+    # INSERT and one bulk UPDATE by primary key.
+    new_rows = [values for cid, values in batch.items() if cid not in existing]
+    kept = {'id', 'year', *columns}
+    updated_rows = [
+        {k: v for k, v in values.items() if k in kept and not (k == 'year' and v is None)}
+        for cid, values in batch.items() if cid in existing
+    ]
+    if new_rows:
+        session.execute(insert(Citation.__table__), new_rows)
+    if updated_rows:
+        session.execute(update(Citation), updated_rows)
+
+
+def _as_frames(data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> Iterable[pd.DataFrame]:
+    """Return the DataFrames of a loader input, which may be one frame or many."""
+    return (data,) if isinstance(data, pd.DataFrame) else data
+
+
+def bulk_insert_citations(
+    data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    chunk_size: int = _UPSERT_CHUNK_SIZE,
+) -> Dict[str, int]:
+    """Insert or update citations from a DataFrame or an iterable of DataFrames.
+
+    Rows are accumulated into batches of ``chunk_size`` and written
+    with a single ``INSERT ... ON CONFLICT DO UPDATE`` statement per
+    batch, all inside one transaction.  An iterable (for example the
+    chunks of a streamed CSV) is consumed lazily, so only one input
+    frame and one batch are held at a time.  Existing IDs are
+    updated in place, which makes repeated invocations idempotent;
+    columns absent from an input frame keep their stored values.
+    The function returns a dictionary with counts of inserted, updated
+    and skipped records.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    stats = {"inserted": 0, "updated": 0, "skipped": 0, "total": 0}
+    with get_db() as session:
+        batch: Dict[str, Dict[str, Any]] = {}
+        columns: Tuple[str, ...] = ()
+        for df in _as_frames(data):
+            stats["total"] += len(df)
+            frame_columns = _updated_columns(df)
+            if frame_columns != columns:
+                # a batch only mixes frames that supply the same columns
+                if batch:
+                    _write_citation_batch(session, batch, columns, stats)
+                    batch = {}
+                columns = frame_columns
+            for values in _serialise_frame(df).to_dict('records'):
+                citation_id = values['id']
+                if not citation_id:
+                    stats["skipped"] += 1
+                    continue
+                if citation_id in batch:
+                    # a repeated ID within the batch is an update of the earlier row
+                    stats["updated"] += 1
+                batch[citation_id] = values
+                if len(batch) >= chunk_size:
+                    _write_citation_batch(session, batch, columns, stats)
+                    batch = {}
+        if batch:
+            _write_citation_batch(session, batch, columns, stats)
+    _bump_corpus_version()
+    return stats
+
+
+def _bump_corpus_version() -> None:
+    """Record that the citations table has changed."""
+    global _corpus_version
+    _corpus_version += 1
+
+
+def _stage_merge_sql(stage_table: str, updated: Sequence[str]) -> str:
+    """Return the SQL merging a staging table into ``citations``.
+
+    Existing citations are updated only in the ``updated`` columns.
+    """
+    columns = ('id', 'year') + _UPSERT_COLUMNS
+    selected = ', '.join('CAST(year AS INTEGER)' if col == 'year' else col for col in columns)
+    updates = ''.join(f'{col} = excluded.{col}, ' for col in updated)
+    # ``WHERE true`` disambiguates ON CONFLICT from a join clause in SQLite
+    return (
+        f"INSERT INTO citations ({', '.join(columns)}) "
+        f"SELECT {selected} FROM {stage_table} WHERE true "
+        f"ON CONFLICT (id) DO UPDATE SET {updates}"
+        f"year = coalesce(excluded.year, citations.year)"
+    )
+
+
+def bulk_insert_citations_fast(
+    data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    chunk_size: int = _STAGE_CHUNK_SIZE,
+) -> Dict[str, int]:
+    """Load citations through a staging table written by ``DataFrame.to_sql``.
+
+    Each input frame is serialised and written in chunks of
+    ``chunk_size`` rows by pandas into a scratch table, then merged into
+    ``citations`` by one ``INSERT ... SELECT ... ON CONFLICT DO UPDATE``
+    statement, bypassing per‑row parameter handling in SQLAlchemy.
+    ``data`` may be a single DataFrame or an iterable of them; all
+    frames are loaded in one transaction.  The merge is an upsert
+    rather than ``INSERT OR REPLACE`` so existing rows keep their
+    ``created_at`` and any columns missing from the input frame, and the
+    full‑text triggers see updates, not deletes.
+    Dialects without ``ON CONFLICT`` use ``bulk_insert_citations``.
+    Returns the same counts as ``bulk_insert_citations``.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    if engine.dialect.name not in ('sqlite', 'postgresql'):
+        return bulk_insert_citations(data, chunk_size)
+    stats = {"inserted": 0, "updated": 0, "skipped": 0, "total": 0}
+    with engine.begin() as conn:
+        for df in _as_frames(data):
+            _stage_and_merge(conn, df, chunk_size, stats)
+    _bump_corpus_version()
     return stats
 
 
+def _stage_and_merge(conn: Any, df: pd.DataFrame, chunk_size: int, stats: Dict[str, int]) -> None:
+    """Stage one frame of citations and merge it into ``citations``."""
+    stats["total"] += len(df)
+    frame = _serialise_frame(df)
+    has_id = frame['id'] != ''
+    stats["skipped"] += int((~has_id).sum())
+    frame = frame[has_id]
+    # a repeated ID within the frame is an update of the earlier row
+    repeated = frame['id'].duplicated(keep='last')
+    stats["updated"] += int(repeated.sum())
+    frame = frame[~repeated]
+    if frame.empty:
+        return
+    # A uniquely named staging table keeps concurrent loads (two UI
+    # sessions, or the API and the UI) from overwriting each other
+    stage_table = f"{_STAGE_TABLE}_{uuid.uuid4().hex}"
+    # Multi‑row VALUES saves network round trips on PostgreSQL; the
+    # in‑process SQLite driver is faster with a plain executemany.
+    stage_method = 'multi' if engine.dialect.name == 'postgresql' else None
+    try:
+        frame.to_sql(
+            stage_table, conn, if_exists='fail', index=False,
+            method=stage_method, chunksize=chunk_size,
+        )
+        existing = conn.execute(text(
+            f"SELECT COUNT(*) FROM {stage_table} s JOIN citations c ON c.id = s.id"
+        )).scalar_one()
+        conn.execute(text(_stage_merge_sql(stage_table, _updated_columns(df))))
+    finally:
+        # After a failure the transaction is rolled back, which discards
+        # the table as well, so an error from the drop itself is ignored
+        with suppress(SQLAlchemyError):
+            conn.execute(text(f"DROP TABLE IF EXISTS {stage_table}"))
+    stats["updated"] += existing
+    stats["inserted"] += len(frame) - existing
+
+
+def _snippet(source: str) -> str:
+    """Truncate text to 200 characters for search result snippets."""
+    return source[:200] + '...' if len(source) > 200 else source
+
+
+def _citation_url(citation_id: str, doi: Optional[str]) -> str:
+    """Build a PubMed/arXiv URL from the ID prefix, else a DOI URL if possible."""
+    prefix, sep, local_id = citation_id.partition(':')
+    if sep and prefix in _ID_URL_TEMPLATES:
+        return _ID_URL_TEMPLATES[prefix].format(local_id)
+    return f'https://doi.org/{doi}' if doi else ''
+
+
+def _citation_urls(ids: pd.Series, doi: pd.Series) -> pd.Series:
+    """Column‑wise ``_citation_url``, with ``None`` where there is no URL."""
+    local_ids = ids.str.replace(r'^[^:]*:', '', regex=True)
+    urls = pd.Series(None, index=ids.index, dtype=object)
+    for prefix, template in _ID_URL_TEMPLATES.items():
+        head, tail = template.split('{}')
+        urls = urls.mask(ids.str.startswith(prefix + ':'), head + local_ids + tail)
+    has_doi = doi.notna() & (doi.astype(str) != '')
+    return urls.mask(urls.isna() & has_doi, 'https://doi.org/' + doi.astype(str))
+
+
+def list_search_results(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Return citations as search results without filtering on a query.
+
+    The snippet (the abstract, else the title, cut to 200 characters)
+    is built by the database and the URL is the one stored when the
+    citation was written, so rows are returned without per‑row string
+    work in Python.
+    """
+    stmt = select(Citation.id, Citation.title, _SNIPPET_SQL, Citation.url)
+    if limit:
+        stmt = stmt.limit(limit)
+    with engine.connect() as conn:
+        rows = conn.execute(stmt).all()
+    return [
+        {'id': citation_id, 'title': title, 'text': snippet, 'url': url or ''}
+        for citation_id, title, snippet, url in rows
+    ]
+
+
 def search_citations(query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-    """Perform a simple full‑text search over titles and abstracts.
+    """Perform a full‑text search over titles and abstracts.
 
-    The search uses a case‑insensitive LIKE query to find citations
-    where the query string appears in either the title or the abstract.
-    Results are returned as a list of dictionaries containing the
-    citation ID, title, a short snippet and a placeholder URL.
+    On SQLite the query is matched against the FTS5 index, results
+    are ranked by BM25 and the snippet is the part of the abstract
+    around the matched words; on PostgreSQL a ``tsvector`` match ranked by
+    ``ts_rank`` is used.  Every word of the query must be present.
+    Other databases, or a SQLite build without FTS5, fall back to a
+    case‑insensitive LIKE over the title and abstract.  Results are
+    returned as a list of dictionaries containing the citation ID,
+    title, a short snippet and the stored URL.
 
     Args:
         query: Search query string.
@@ -201,100 +737,161 @@ def search_citations(query: str, limit: Optional[int] = None) -> List[Dict[str,
     """
     if not query or not query.strip():
         return []
-    pattern = f"%{query.strip()}%"
     with get_db() as session:
-        results = session.query(Citation).filter(
-            (Citation.title.ilike(pattern)) | (Citation.abstract.ilike(pattern))
-        )
-        if limit:
-            results = results.limit(limit)
-        formatted: List[Dict[str, Any]] = []
-        for citation in results:
-            snippet_source = citation.abstract or citation.title
-            snippet = (snippet_source[:200] + '...') if snippet_source and len(snippet_source) > 200 else (snippet_source or '')
-            url = ''
-            # attempt to build a PubMed or DOI URL if possible
-            if citation.id.startswith('PMID:'):
-                pmid = citation.id.replace('PMID:', '')
-                url = f'https://pubmed.ncbi.nlm.nih.gov/{pmid}/'
-            elif citation.doi:
-                url = f'https://doi.org/{citation.doi}'
-            formatted.append({
-                'id': citation.id,
-                'title': citation.title,
-                'text': snippet,
-                'url': url,
-            })
-        return formatted
-
-
-def get_all_citations(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        if _fts_available() and engine.dialect.name == 'sqlite':
+            match = _fts_match_query(query)
+            if not match:
+                return []
+            rows = session.execute(_SQLITE_FTS_SEARCH, {'query': match, 'limit': limit or -1}).all()
+            return [
+                {
+                    'id': citation_id,
+                    'title': title,
+                    'text': snippet or _snippet(title or ''),
+                    'url': url or '',
+                }
+                for citation_id, title, snippet, url in rows
+            ]
+        elif _fts_available() and engine.dialect.name == 'postgresql':
+            rows = session.execute(_PG_FTS_SEARCH, {'query': query.strip(), 'limit': limit}).all()
+        else:
+            pattern = f"%{query.strip()}%"
+            stmt = select(Citation.id, Citation.title, Citation.abstract, Citation.url).where(
+                (Citation.title.ilike(pattern)) | (Citation.abstract.ilike(pattern))
+            )
+            if limit:
+                stmt = stmt.limit(limit)
+            rows = session.execute(stmt).all()
+        return [
+            {
+                'id': citation_id,
+                'title': title,
+                'text': _snippet(abstract or title or ''),
+                'url': url or '',
+            }
+            for citation_id, title, abstract, url in rows
+        ]
+
+
+@lru_cache(maxsize=4096)
+def _decode_list(stored: str) -> Tuple[str, ...]:
+    """Decode a stored list column, caching repeated values.
+
+    Lists are stored as JSON arrays; MeSH terms and keywords written
+    by older versions used a ``', '``‑joined string, which is still
+    accepted.
+    """
+    if stored.startswith('['):
+        try:
+            decoded = _json_loads(stored)
+        except ValueError:  # a legacy value that happens to start with ``[``
+            decoded = None
+        if isinstance(decoded, list):
+            return tuple(decoded)
+    return tuple(stored.split(', '))
+
+
+def get_all_citations(
+    limit: Optional[int] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> List[Dict[str, Any]]:
     """Return all citations in the database.
 
-    If a limit is provided, the result set is truncated accordingly.
+    Only the columns named in ``fields`` are selected (all listing
+    fields by default), and list fields are decoded only when
+    requested.  Rows are built as plain dictionaries rather than ORM
+    objects; the whole result is still returned as one list, so use
+    ``limit`` to bound memory on large corpora.
     """
+    selected = tuple(fields) if fields else _LISTING_FIELDS
+    unknown = set(selected) - set(_LISTING_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown citation fields: {', '.join(sorted(unknown))}")
+    stmt = select(*(getattr(Citation, name) for name in selected))
+    if limit:
+        stmt = stmt.limit(limit)
     with get_db() as session:
-        query = session.query(Citation)
-        if limit:
-            query = query.limit(limit)
         citations: List[Dict[str, Any]] = []
-        for c in query:
-            citations.append({
-                'id': c.id,
-                'title': c.title,
-                'abstract': c.abstract,
-                'year': c.year,
-                'authors': json.loads(c.authors) if c.authors else [],
-                'journal': c.journal,
-                'doi': c.doi,
-                'mesh_terms': c.mesh_terms.split(', ') if c.mesh_terms else [],
-                'keywords': c.keywords.split(', ') if c.keywords else [],
-            })
+        for row in session.execute(stmt.execution_options(yield_per=1000)):
+            citation = dict(zip(selected, row))
+            for name in _LIST_FIELDS.intersection(citation):
+                citation[name] = list(_decode_list(citation[name])) if citation[name] else []
+            citations.append(citation)
         return citations
 
 
 def fetch_citation(citation_id: str) -> Optional[Dict[str, Any]]:
     """Retrieve a single citation by its ID.
 
+    The lookup is a Core ``SELECT`` on a pooled connection, built once
+    at import so SQLAlchemy's compiled cache and the driver's statement
+    cache are reused on every call; no ORM session or object is
+    created.
+
     Args:
         citation_id: The unique citation identifier.
 
     Returns:
         A dictionary representing the citation if found, otherwise ``None``.
     """
-    with get_db() as session:
-        citation = session.query(Citation).filter(Citation.id == citation_id).first()
-        if not citation:
-            return None
-        return {
-            'id': citation.id,
-            'title': citation.title,
-            'abstract': citation.abstract,
-            'year': citation.year,
-            'authors': json.loads(citation.authors) if citation.authors else [],
-            'journal': citation.journal,
-            'doi': citation.doi,
-            'mesh_terms': citation.mesh_terms.split(', ') if citation.mesh_terms else [],
-            'keywords': citation.keywords.split(', ') if citation.keywords else [],
-            'raw_data': json.loads(citation.raw_data) if citation.raw_data else {},
-        }
+    with engine.connect() as conn:
+        row = conn.execute(_FETCH_STMT, {'citation_id': citation_id}).first()
+    return None if row is None else _citation_from_row(row)
+
+
+def fetch_citations_bulk(citation_ids: Sequence[str]) -> List[Dict[str, Any]]:
+    """Retrieve several citations with one ``SELECT ... WHERE id IN (...)``.
+
+    Citations are returned in the order of ``citation_ids``; repeated
+    IDs are returned once and unknown IDs are omitted.
+    """
+    wanted = list(dict.fromkeys(citation_ids))
+    if not wanted:
+        return []
+    with engine.connect() as conn:
+        rows = conn.execute(_FETCH_BULK_STMT, {'citation_ids': wanted}).all()
+    found = {row[0]: row for row in rows}
+    return [_citation_from_row(found[cid]) for cid in wanted if cid in found]
+
+
+def _citation_from_row(row: Sequence[Any]) -> Dict[str, Any]:
+    """Build a citation dictionary from a row of ``_FETCH_COLUMNS``."""
+    (cid, title, abstract, year, authors, journal, doi, mesh_terms, keywords, raw_data) = row
+    return {
+        'id': cid,
+        'title': title,
+        'abstract': abstract,
+        'year': year,
+        'authors': list(_decode_list(authors)) if authors else [],
+        'journal': journal,
+        'doi': doi,
+        'mesh_terms': list(_decode_list(mesh_terms)) if mesh_terms else [],
+        'keywords': list(_decode_list(keywords)) if keywords else [],
+        'raw_data': _json_loads(raw_data) if raw_data else {},
+    }
+
+
+def get_corpus_version() -> int:
+    """Return a counter that changes whenever this process loads citations.
+
+    Callers caching corpus statistics can key the cache on this value
+    instead of querying the database to detect changes.  Writes made by
+    other processes are not counted, so such caches should also expire.
+    """
+    return _corpus_version
 
 
 def get_corpus_stats() -> Dict[str, Any]:
     """Return simple statistics about the loaded citation corpus."""
     with get_db() as session:
-        total = session.query(Citation).count()
-        # compute year distribution
-        year_counts: Dict[int, int] = {}
-        for year, count in session.query(Citation.year, text('COUNT(*)')).group_by(Citation.year):
-            if year is not None:
-                year_counts[int(year)] = int(count)
-        year_distribution = [
-            {'year': year, 'count': count} for year, count in sorted(year_counts.items())
-        ]
+        total = session.execute(text("SELECT COUNT(*) FROM citations")).scalar_one()
+        rows = session.execute(text(
+            "SELECT year, COUNT(*) FROM citations "
+            "WHERE year IS NOT NULL GROUP BY year ORDER BY year"
+        )).all()
         return {
             'total_citations': total,
-            'year_distribution': year_distribution,
+            'year_distribution': [{'year': year, 'count': count} for year, count in rows],
         }
 
 
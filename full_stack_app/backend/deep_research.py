@@ -12,9 +12,12 @@ functions.
 
 from __future__ import annotations
 
+import json
 import os
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 try:
     from openai import OpenAI  # type: ignore
@@ -24,6 +27,7 @@ except Exception as e:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def _resolve_api_key() -> str:
     """Resolve a single OpenAI API key from environment variables."""
     single = os.getenv('OPENAI_API_KEY')
@@ -38,6 +42,23 @@ def _resolve_api_key() -> str:
     )
 
 
+@lru_cache(maxsize=8)
+def _resolve_mcp_url(mcp_url: Optional[str]) -> str:
+    """Determine the MCP URL, allowing hosted platforms to override it.
+
+    The environment is only probed on the first call for a given
+    ``mcp_url`` since these variables do not change in‑process.
+    """
+    if os.getenv('HEROKU_APP_NAME'):
+        app_name = os.getenv('HEROKU_APP_NAME')
+        return f"https://{app_name}.herokuapp.com/sse/"
+    if os.getenv('REPL_SLUG') and os.getenv('REPL_OWNER'):
+        slug = os.getenv('REPL_SLUG')
+        owner = os.getenv('REPL_OWNER')
+        return f"https://{slug}-8001.{owner}.repl.co/sse/"
+    return mcp_url or 'http://localhost:8001/sse/'
+
+
 # Initialise the OpenAI client lazily.  The API key is resolved at
 # import time so that missing keys cause immediate errors when this
 # module is used.
@@ -45,43 +66,38 @@ API_KEY: str = _resolve_api_key()
 MODEL: str = os.getenv('DEEP_RESEARCH_MODEL', 'o3-deep-research-2025-06-26')
 client = OpenAI(api_key=API_KEY, timeout=3600)
 
+# Background job states that are polled until they change, and the
+# first and largest delay in seconds between polls
+_PENDING_STATUSES = frozenset({'queued', 'in_progress'})
+_POLL_INITIAL_DELAY = 0.5
+_POLL_MAX_DELAY = 10.0
 
-def launch_screening_job(
-    pico_criteria: Dict[str, str],
-    inclusion_criteria: List[str],
-    exclusion_criteria: List[str],
-    corpus_size: int,
-    mcp_url: Optional[str] = None,
-    search_mode: str = 'fulltext',
-) -> Any:
-    """Launch a Deep Research screening job.
+# PICOTT keys substituted into the screening prompt
+_PICO_KEYS = ('population', 'intervention', 'comparator', 'outcome', 'timeframe', 'study_type')
 
-    This helper assembles a prompt describing the systematic review
-    screening task using the provided criteria and submits it to the
-    OpenAI API.  The returned response object can be passed to
-    :func:`poll_job_status` to extract the final results.
-    """
-    # Compose the screening task prompt
-    task = f"""You are conducting a systematic review screening of {corpus_size} research citations.
-The citations are available through the MCP search and fetch tools.
+# Screening task prompt, formatted once per job with ``str.format_map``.
+# Literal braces in the JSON example are doubled.
+_SCREENING_PROMPT = """You are conducting a systematic review screening of {corpus_size} research citations.
+The citations are available through the MCP search, fetch and fetch_bulk tools.
 
 IMPORTANT: Use search mode="{search_mode}" for all search operations.
+IMPORTANT: To retrieve more than one citation, use fetch_bulk (POST /fetch_bulk with {{"ids": [...]}}, up to 500 IDs per call) instead of calling fetch once per citation.
 
 Your task is to screen each citation based on the following criteria:
 
 ## PICOTT Criteria (ALL must match for inclusion):
-- Population: {pico_criteria.get('population', 'Not specified')}
-- Intervention: {pico_criteria.get('intervention', 'Not specified')}
-- Comparator: {pico_criteria.get('comparator', 'Not specified')}
-- Outcome: {pico_criteria.get('outcome', 'Not specified')}
-- Timeframe: {pico_criteria.get('timeframe', 'Not specified')}
-- Study Type: {pico_criteria.get('study_type', 'Not specified')}
+- Population: {population}
+- Intervention: {intervention}
+- Comparator: {comparator}
+- Outcome: {outcome}
+- Timeframe: {timeframe}
+- Study Type: {study_type}
 
 ## Additional Inclusion Criteria:
-{chr(10).join(f'- {c}' for c in inclusion_criteria)}
+{inclusion_block}
 
 ## Exclusion Criteria:
-{chr(10).join(f'- {c}' for c in exclusion_criteria)}
+{exclusion_block}
 
 ## Instructions:
 1. Search the corpus systematically to identify all potentially relevant citations
@@ -112,30 +128,65 @@ Return your results as a JSON array where each citation has this structure:
 ]
 
 Focus on extracting EXACT quotes that support each PICOTT element and criterion match."""
-    # Determine the MCP URL: allow override via environment variables for hosted platforms
-    if os.getenv('HEROKU_APP_NAME'):
-        app_name = os.getenv('HEROKU_APP_NAME')
-        mcp_url = f"https://{app_name}.herokuapp.com/sse/"
-    elif os.getenv('REPL_SLUG') and os.getenv('REPL_OWNER'):
-        slug = os.getenv('REPL_SLUG')
-        owner = os.getenv('REPL_OWNER')
-        mcp_url = f"https://{slug}-8001.{owner}.repl.co/sse/"
-    else:
-        mcp_url = mcp_url or 'http://localhost:8001/sse/'
+
+
+def _screening_request(
+    pico_criteria: Dict[str, str],
+    inclusion_criteria: List[str],
+    exclusion_criteria: List[str],
+    corpus_size: int,
+    mcp_url: Optional[str],
+    search_mode: str,
+) -> Dict[str, Any]:
+    """Build the keyword arguments of a screening ``responses.create`` call."""
+    fields = {key: pico_criteria.get(key, 'Not specified') for key in _PICO_KEYS}
+    task = _SCREENING_PROMPT.format_map({
+        **fields,
+        'corpus_size': corpus_size,
+        'search_mode': search_mode,
+        'inclusion_block': '\n'.join(map('- {}'.format, inclusion_criteria)),
+        'exclusion_block': '\n'.join(map('- {}'.format, exclusion_criteria)),
+    })
+    return {
+        'model': MODEL,
+        'input': task,
+        'tools': [
+            {'type': 'web_search_preview'},
+            {
+                'type': 'mcp',
+                'server_label': 'DeepResearchServer',
+                'server_url': _resolve_mcp_url(mcp_url),
+                'require_approval': 'never',
+            },
+        ],
+    }
+
+
+def launch_screening_job(
+    pico_criteria: Dict[str, str],
+    inclusion_criteria: List[str],
+    exclusion_criteria: List[str],
+    corpus_size: int,
+    mcp_url: Optional[str] = None,
+    search_mode: str = 'fulltext',
+    background: bool = False,
+) -> Any:
+    """Launch a Deep Research screening job.
+
+    This helper assembles a prompt describing the systematic review
+    screening task using the provided criteria and submits it to the
+    OpenAI API.  The returned response object can be passed to
+    :func:`poll_job_status` to extract the final results.  With
+    ``background=True`` the job is queued and this call returns at
+    once instead of holding the request open until the job finishes.
+    """
+    request = _screening_request(
+        pico_criteria, inclusion_criteria, exclusion_criteria, corpus_size, mcp_url, search_mode
+    )
+    if background:
+        request['background'] = True
     try:
-        response = client.responses.create(
-            model=MODEL,
-            input=task,
-            tools=[
-                {'type': 'web_search_preview'},
-                {
-                    'type': 'mcp',
-                    'server_label': 'DeepResearchServer',
-                    'server_url': mcp_url,
-                    'require_approval': 'never',
-                },
-            ],
-        )
+        response = client.responses.create(**request)
         logger.info(f"Launched screening job: {getattr(response, 'id', 'unknown')}")
         return response
     except Exception as e:
@@ -143,9 +194,141 @@ Focus on extracting EXACT quotes that support each PICOTT element and criterion
         raise
 
 
+class ScreeningStream:
+    """Iterate over screening decisions while the model is still writing them.
+
+    Wraps the server‑sent event stream of a ``responses.create(...,
+    stream=True)`` call.  Output text deltas are accumulated and each
+    object of the top‑level JSON array is decoded and yielded as soon as
+    its closing brace arrives.  The array is taken to start at the first
+    ``[`` followed by ``{`` or ``]``, so bracketed prose before it (such
+    as "reviewed [12] citations") is skipped.  After iteration
+    ``content`` holds the complete output text, e.g. for a full parse
+    when no decisions were found.
+    """
+
+    def __init__(self, events: Iterable[Any]) -> None:
+        self._events = events
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = -1  # index just past the opening ``[``, or -1 before it
+        self._scan = 0  # where the search for the opening ``[`` resumes
+        self._done = False
+        self.response_id: Optional[str] = None
+
+    @property
+    def content(self) -> str:
+        """The output text received so far."""
+        return self._buffer
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for event in self._events:
+            event_type = getattr(event, 'type', '')
+            if event_type == 'response.created':
+                self.response_id = getattr(event.response, 'id', None)
+                logger.info(f"Streaming screening job: {self.response_id}")
+            elif event_type == 'response.output_text.delta':
+                self._buffer += event.delta
+                if not self._done and '}' in event.delta:
+                    yield from self._drain()
+            elif event_type in ('response.failed', 'error'):
+                error = getattr(getattr(event, 'response', None), 'error', None) or getattr(event, 'message', '')
+                raise RuntimeError(f'Screening job failed: {error}')
+
+    def _drain(self) -> Iterator[Dict[str, Any]]:
+        """Yield every complete array element buffered since the last call."""
+        buffer = self._buffer
+        while self._pos < 0:
+            start = buffer.find('[', self._scan)
+            if start < 0:
+                self._scan = len(buffer)
+                return
+            nxt = start + 1
+            while nxt < len(buffer) and buffer[nxt].isspace():
+                nxt += 1
+            if nxt >= len(buffer):
+                self._scan = start  # decide once more text arrives
+                return
+            if buffer[nxt] in '{]':
+                self._pos = start + 1
+            else:
+                self._scan = start + 1
+        while True:
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(buffer):
+                return
+            if buffer[pos] == ']':
+                self._done = True
+                return
+            try:
+                value, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                return  # element not complete yet
+            self._pos = end
+            if isinstance(value, dict):
+                yield value
+
+
+def stream_screening_job(
+    pico_criteria: Dict[str, str],
+    inclusion_criteria: List[str],
+    exclusion_criteria: List[str],
+    corpus_size: int,
+    mcp_url: Optional[str] = None,
+    search_mode: str = 'fulltext',
+) -> ScreeningStream:
+    """Launch a screening job and stream its decisions as they are produced.
+
+    Takes the same arguments as :func:`launch_screening_job` but keeps a
+    single streaming connection open instead of waiting for the whole
+    response, so callers can display partial results.
+    """
+    request = _screening_request(
+        pico_criteria, inclusion_criteria, exclusion_criteria, corpus_size, mcp_url, search_mode
+    )
+    try:
+        events = client.responses.create(**request, stream=True)
+    except Exception as e:
+        logger.error(f"Failed to launch screening job: {e}")
+        raise
+    return ScreeningStream(events)
+
+
+def wait_for_job(response: Any, timeout: Optional[float] = None) -> Any:
+    """Poll a background response until it leaves the queued/running states.
+
+    The delay between ``responses.retrieve`` calls starts at
+    ``_POLL_INITIAL_DELAY`` seconds and doubles up to
+    ``_POLL_MAX_DELAY``, so short jobs are noticed quickly without
+    polling long ones every few seconds.  The SDK reuses one HTTP
+    connection pool for every poll.  Raises ``TimeoutError`` if
+    ``timeout`` seconds pass first and ``RuntimeError`` if the job
+    failed or was cancelled.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = _POLL_INITIAL_DELAY
+    while getattr(response, 'status', None) in _PENDING_STATUSES:
+        if deadline is not None and time.monotonic() + delay > deadline:
+            raise TimeoutError(f"Screening job {response.id} did not finish within {timeout} seconds")
+        time.sleep(delay)
+        delay = min(delay * 2, _POLL_MAX_DELAY)
+        response = client.responses.retrieve(response.id)
+    if getattr(response, 'status', None) in ('failed', 'cancelled'):
+        error = getattr(response, 'error', None)
+        raise RuntimeError(f"Screening job {response.id} {response.status}: {error}")
+    return response
+
+
 def poll_job_status(response: Any) -> Dict[str, Any]:
-    """Extract the final results from a Deep Research API response object."""
+    """Extract the final results from a Deep Research API response object.
+
+    A response still queued or in progress (a background job) is first
+    waited for with :func:`wait_for_job`.
+    """
     try:
+        response = wait_for_job(response)
         # Newer API versions return responses in `output`
         if hasattr(response, 'output') and response.output:
             final_output = response.output[-1]
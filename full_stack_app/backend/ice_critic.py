@@ -13,8 +13,44 @@ unreasonable.
 from __future__ import annotations
 
 import re
-from collections import Counter
-from typing import Any, Dict, List, Tuple
+import zlib
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Sequence, Set, Tuple
+
+import numpy as np  # type: ignore
+
+try:
+    # Optional JIT compiler for the candidate similarity kernel
+    from numba import njit  # type: ignore
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
+# Vectorised popcount used for the bitset similarity path (NumPy 2.0+)
+HAS_BITWISE_COUNT = hasattr(np, 'bitwise_count')
+
+# Words ignored when comparing exclusion reasons
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of',
+    'with', 'by', 'from', 'not', 'no', 'does', 'did', 'is', 'was'
+})
+_WORD_RE = re.compile(r'\w+')
+
+# Reason lists shorter than this are compared exhaustively; longer lists
+# only compare pairs that share a MinHash LSH bucket.
+_LSH_MIN_REASONS = 64
+# 21 bands of 3 rows: pairs at the 0.7 Jaccard threshold share a bucket
+# with probability 1 - (1 - 0.7**3)**21 > 0.9998.
+_LSH_BANDS = 21
+_LSH_ROWS = 3
+_MINHASH_PRIME = (1 << 31) - 1
+# Vocabularies up to this many words are scored as 256‑bit masks
+_BITSET_WORDS = 4
+_BITSET_MAX_VOCAB = 64 * _BITSET_WORDS
+_minhash_rng = np.random.default_rng(20240229)
+_MINHASH_A = _minhash_rng.integers(1, _MINHASH_PRIME, _LSH_BANDS * _LSH_ROWS, dtype=np.uint64)
+_MINHASH_B = _minhash_rng.integers(0, _MINHASH_PRIME, _LSH_BANDS * _LSH_ROWS, dtype=np.uint64)
 
 
 def analyze_screening_consistency(
@@ -34,50 +70,62 @@ def analyze_screening_consistency(
         A dictionary with ``issues`` (list of issue dictionaries) and
         ``summary`` (aggregated statistics).
     """
-    issues: List[Dict[str, Any]] = []
-    # Check for missing PICOTT elements on included citations
+    # PICOTT elements that must be present on included citations
+    required = [
+        (key, key if key != 'study_type' else 'studyType')
+        for key, criteria_val in pico_criteria.items()
+        if criteria_val and criteria_val != 'Not specified'
+    ]
+    # One pass over the results evaluates every per‑citation rule; issues
+    # are collected per rule so the report keeps its rule‑by‑rule order.
+    picott_issues: List[Dict[str, Any]] = []
+    confidence_issues: List[Dict[str, Any]] = []
+    exclusion_reasons: List[Any] = []
+    confidence_counts: Counter = Counter()
+    inclusion_count = 0
     for result in screening_results:
         include = result.get('include') or result.get('decision') == 'Include'
-        picott = result.get('picott', {})
-        if include and picott:
-            missing: List[str] = []
-            for key, criteria_val in pico_criteria.items():
-                if criteria_val and criteria_val != 'Not specified':
-                    element_key = key if key != 'study_type' else 'studyType'
-                    if element_key in picott and (not picott[element_key] or picott[element_key] == 'Not found'):
-                        missing.append(key)
-            if missing:
-                issues.append({
-                    'type': 'PICOTT_elements_missing',
+        label = result.get('confidence', 'unknown')
+        confidence_counts[label] += 1
+        confidence = str(label).lower()
+        if include:
+            inclusion_count += 1
+            picott = result.get('picott')
+            if picott:
+                missing = [
+                    key for key, element_key in required
+                    if element_key in picott and (not picott[element_key] or picott[element_key] == 'Not found')
+                ]
+                if missing:
+                    picott_issues.append({
+                        'type': 'PICOTT_elements_missing',
+                        'citation_id': result.get('id'),
+                        'severity': 'high',
+                        'description': f"Citation included but missing PICOTT elements: {', '.join(missing)}",
+                        'suggestion': 'Verify if abstract contains required PICOTT elements',
+                    })
+            if confidence == 'low':
+                confidence_issues.append({
+                    'type': 'low_confidence_inclusion',
                     'citation_id': result.get('id'),
-                    'severity': 'high',
-                    'description': f"Citation included but missing PICOTT elements: {', '.join(missing)}",
-                    'suggestion': 'Verify if abstract contains required PICOTT elements',
+                    'severity': 'medium',
+                    'description': 'Citation included with low confidence',
+                    'suggestion': 'Consider full‑text review to confirm inclusion',
                 })
-    # Confidence vs decision consistency
-    for result in screening_results:
-        include = result.get('include') or result.get('decision') == 'Include'
-        confidence = result.get('confidence', '').lower()
-        if include and confidence == 'low':
-            issues.append({
-                'type': 'low_confidence_inclusion',
-                'citation_id': result.get('id'),
-                'severity': 'medium',
-                'description': 'Citation included with low confidence',
-                'suggestion': 'Consider full‑text review to confirm inclusion',
-            })
-        if not include and confidence == 'high':
-            issues.append({
-                'type': 'high_confidence_exclusion',
-                'citation_id': result.get('id'),
-                'severity': 'low',
-                'description': 'Citation excluded with high confidence – verify exclusion reason',
-                'suggestion': 'Double‑check exclusion criteria are correctly applied',
-            })
+        else:
+            exclusion_reasons.append(result.get('reason'))
+            if confidence == 'high':
+                confidence_issues.append({
+                    'type': 'high_confidence_exclusion',
+                    'citation_id': result.get('id'),
+                    'severity': 'low',
+                    'description': 'Citation excluded with high confidence – verify exclusion reason',
+                    'suggestion': 'Double‑check exclusion criteria are correctly applied',
+                })
+    issues: List[Dict[str, Any]] = picott_issues + confidence_issues
     # Analyse exclusion reason wording
-    exclusion_reasons = [r.get('reason') for r in screening_results if not (r.get('include') or r.get('decision') == 'Include')]
-    reason_counts = Counter(exclusion_reasons)
-    similar_groups = find_similar_reasons([r for r in reason_counts.keys() if r])
+    unique_reasons = dict.fromkeys(exclusion_reasons)
+    similar_groups = find_similar_reasons([r for r in unique_reasons if r])
     for group in similar_groups:
         if len(group) > 1:
             issues.append({
@@ -89,7 +137,6 @@ def analyze_screening_consistency(
             })
     # Inclusion rate analysis
     total = len(screening_results)
-    inclusion_count = sum(1 for r in screening_results if r.get('include') or r.get('decision') == 'Include')
     inclusion_rate = (inclusion_count / total) if total > 0 else 0.0
     if inclusion_rate < 0.01:
         issues.append({
@@ -108,20 +155,32 @@ def analyze_screening_consistency(
             'suggestion': 'Verify that screening criteria are sufficiently specific',
         })
     # Build summary
+    severity_counts = Counter(issue['severity'] for issue in issues)
     summary = {
         'total_issues': len(issues),
-        'high_severity': sum(1 for i in issues if i['severity'] == 'high'),
-        'medium_severity': sum(1 for i in issues if i['severity'] == 'medium'),
-        'low_severity': sum(1 for i in issues if i['severity'] == 'low'),
+        'high_severity': severity_counts['high'],
+        'medium_severity': severity_counts['medium'],
+        'low_severity': severity_counts['low'],
         'inclusion_rate': inclusion_rate,
-        'confidence_distribution': Counter(r.get('confidence', 'unknown') for r in screening_results),
-        'unique_exclusion_reasons': len(reason_counts),
+        'confidence_distribution': confidence_counts,
+        'unique_exclusion_reasons': len(unique_reasons),
     }
     return {'issues': issues, 'summary': summary}
 
 
 def find_similar_reasons(reasons: List[str]) -> List[List[str]]:
-    """Group similar exclusion reason strings based on word overlap."""
+    """Group similar exclusion reason strings based on word overlap.
+
+    Each reason is grouped greedily with later, not yet grouped reasons
+    whose word Jaccard similarity exceeds 0.7.  Long lists are first
+    bucketed with MinHash LSH so only likely matches are compared.
+    """
+    tokens = [_reason_tokens(reason) for reason in reasons]
+    if len(reasons) >= _LSH_MIN_REASONS:
+        neighbours = _lsh_candidates(tokens)
+    else:
+        neighbours = [range(i + 1, len(reasons)) for i in range(len(reasons))]
+    later_matches = _match_finder(tokens, neighbours)
     groups: List[List[str]] = []
     used: set[str] = set()
     for i, reason1 in enumerate(reasons):
@@ -129,10 +188,9 @@ def find_similar_reasons(reasons: List[str]) -> List[List[str]]:
             continue
         group = [reason1]
         used.add(reason1)
-        for reason2 in reasons[i + 1:]:
-            if reason2 in used:
-                continue
-            if calculate_reason_similarity(reason1, reason2) > 0.7:
+        for j in later_matches(i):
+            reason2 = reasons[j]
+            if reason2 not in used:
                 group.append(reason2)
                 used.add(reason2)
         if len(group) > 1:
@@ -140,18 +198,136 @@ def find_similar_reasons(reasons: List[str]) -> List[List[str]]:
     return groups
 
 
-def calculate_reason_similarity(r1: str, r2: str) -> float:
-    """Compute a simple similarity measure between two strings."""
-    words1 = set(re.findall(r'\w+', r1.lower()))
-    words2 = set(re.findall(r'\w+', r2.lower()))
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of',
-        'with', 'by', 'from', 'not', 'no', 'does', 'did', 'is', 'was'
-    }
-    words1 = {w for w in words1 if w not in stop_words}
-    words2 = {w for w in words2 if w not in stop_words}
+def _match_finder(
+    tokens: List[FrozenSet[str]],
+    neighbours: Sequence[Sequence[int]],
+) -> Callable[[int], List[int]]:
+    """Return a function listing the candidates of ``i`` above the threshold.
+
+    Uses the Numba kernel when available.  Otherwise small vocabularies
+    are scored as fixed‑width bitsets with vectorised popcounts, and the
+    fallback scores each reason's candidates on demand.
+    """
+    flat, offsets = _encode_token_sets(tokens)
+    if HAS_NUMBA:
+        def numba_matches(i: int) -> List[int]:
+            candidates = np.asarray(neighbours[i], dtype=np.int64)
+            scores = _jaccard_candidates(flat, offsets, i, candidates)
+            return candidates[scores > 0.7].tolist()
+        return numba_matches
+    if HAS_BITWISE_COUNT and (flat.size == 0 or int(flat.max()) < _BITSET_MAX_VOCAB):
+        masks = _encode_bitsets(flat, offsets)
+        sizes = np.diff(offsets)
+
+        def bitset_matches(i: int) -> List[int]:
+            candidates = np.asarray(neighbours[i], dtype=np.int64)
+            shared = np.bitwise_count(masks[candidates] & masks[i]).sum(axis=1, dtype=np.int64)
+            union = sizes[candidates] + sizes[i] - shared
+            scores = shared / np.maximum(union, 1)
+            return candidates[scores > 0.7].tolist()
+        return bitset_matches
+    return lambda i: _match_block(tokens, neighbours[i:i + 1], i)[0]
+
+
+def _match_block(
+    tokens: List[FrozenSet[str]],
+    neighbours: Sequence[Sequence[int]],
+    start: int,
+) -> List[List[int]]:
+    """List candidates above the similarity threshold for consecutive rows."""
+    return [
+        [j for j in candidates if _jaccard(tokens[start + k], tokens[j]) > 0.7]
+        for k, candidates in enumerate(neighbours)
+    ]
+
+
+def _lsh_candidates(tokens: List[FrozenSet[str]]) -> List[List[int]]:
+    """Return, for each token set, the sorted indices of later candidates.
+
+    Candidates are token sets sharing at least one LSH band of their
+    MinHash signatures.  Empty sets never match and are left out.
+    """
+    buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+    for i, words in enumerate(tokens):
+        if not words:
+            continue
+        hashes = np.fromiter((zlib.crc32(w.encode('utf-8')) for w in words), dtype=np.uint64, count=len(words))
+        hashes %= _MINHASH_PRIME
+        signature = ((_MINHASH_A[:, None] * hashes[None, :] + _MINHASH_B[:, None]) % _MINHASH_PRIME).min(axis=1)
+        for band, rows in enumerate(signature.reshape(_LSH_BANDS, _LSH_ROWS)):
+            buckets[(band, rows.tobytes())].append(i)
+    later: List[Set[int]] = [set() for _ in tokens]
+    for members in buckets.values():
+        for pos, i in enumerate(members):
+            later[i].update(members[pos + 1:])
+    return [sorted(js) for js in later]
+
+
+def _encode_token_sets(tokens: List[FrozenSet[str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode token sets as sorted integer word IDs in one flat array.
+
+    Returns ``(flat, offsets)`` where the IDs of set ``i`` are
+    ``flat[offsets[i]:offsets[i + 1]]`` in ascending order.
+    """
+    word_ids: Dict[str, int] = {}
+    encoded = [sorted(word_ids.setdefault(w, len(word_ids)) for w in words) for words in tokens]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(ids) for ids in encoded], out=offsets[1:])
+    flat = np.fromiter((w for ids in encoded for w in ids), dtype=np.int32, count=int(offsets[-1]))
+    return flat, offsets
+
+
+def _encode_bitsets(flat: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Pack encoded token sets into an ``(n, _BITSET_WORDS)`` uint64 array.
+
+    Bit ``w`` of row ``i`` is set when word ID ``w`` occurs in set ``i``;
+    IDs must be below ``_BITSET_MAX_VOCAB``.
+    """
+    n = offsets.size - 1
+    bits = np.zeros((n, _BITSET_MAX_VOCAB), dtype=np.bool_)
+    bits[np.repeat(np.arange(n), np.diff(offsets)), flat] = True
+    return np.packbits(bits, axis=1, bitorder='little').view(np.uint64)
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _jaccard_candidates(flat, offsets, i, candidates):  # type: ignore[no-untyped-def]
+        """Jaccard similarity of encoded set ``i`` with each candidate set."""
+        out = np.zeros(candidates.size, np.float64)
+        a_start, a_end = offsets[i], offsets[i + 1]
+        for k in range(candidates.size):
+            j = candidates[k]
+            b_start, b_end = offsets[j], offsets[j + 1]
+            if a_start == a_end or b_start == b_end:
+                continue
+            # two‑pointer merge over the sorted word IDs
+            p, q, shared = a_start, b_start, 0
+            while p < a_end and q < b_end:
+                if flat[p] == flat[q]:
+                    shared += 1
+                    p += 1
+                    q += 1
+                elif flat[p] < flat[q]:
+                    p += 1
+                else:
+                    q += 1
+            out[k] = shared / ((a_end - a_start) + (b_end - b_start) - shared)
+        return out
+
+
+@lru_cache(maxsize=4096)
+def _reason_tokens(reason: str) -> FrozenSet[str]:
+    """Return the lower‑cased words of a reason minus common stop words."""
+    return frozenset(w for w in _WORD_RE.findall(reason.lower()) if w not in _STOP_WORDS)
+
+
+def _jaccard(words1: FrozenSet[str], words2: FrozenSet[str]) -> float:
+    """Return the Jaccard similarity of two word sets, 0 if either is empty."""
     if not words1 or not words2:
         return 0.0
-    intersection = len(words1 & words2)
-    union = len(words1 | words2)
-    return intersection / union
+    return len(words1 & words2) / len(words1 | words2)
+
+
+def calculate_reason_similarity(r1: str, r2: str) -> float:
+    """Compute a simple similarity measure between two strings."""
+    return _jaccard(_reason_tokens(r1), _reason_tokens(r2))
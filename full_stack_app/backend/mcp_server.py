@@ -27,44 +27,85 @@ Endpoints:
   citation given its identifier.  Returns a JSON object containing
   all stored fields.
 
-The application configures CORS to allow requests from any origin so
-that the Streamlit UI running on a different port can call the API
-without restriction.
+* **POST /fetch_bulk** – Retrieve up to 500 citations in one request.
+  The body is ``{"ids": [...]}`` and the response contains a
+  ``citations`` list in the requested order; unknown IDs are omitted.
+
+The application configures CORS to allow ``GET`` and ``POST``
+requests from the Streamlit UI origin (``UI_ORIGIN``, default
+``http://localhost:8000``; several origins may be given separated by
+commas).  Preflight results are cacheable by the browser for a day.
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import threading
 from typing import Any, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
 
 from . import database as db
 
+# Serialise responses with orjson when it is installed.  Newer FastAPI
+# releases serialise response models to JSON bytes through Pydantic and
+# deprecate ORJSONResponse, so it is only used on older releases.
+try:
+    import orjson  # type: ignore  # noqa: F401
+    from fastapi.responses import ORJSONResponse
+    HAS_ORJSON_RESPONSE = not hasattr(ORJSONResponse, '__deprecated__')
+except Exception:
+    HAS_ORJSON_RESPONSE = False
+
 logger = logging.getLogger(__name__)
 
 
 # Create the FastAPI application
-app = FastAPI(title="DeepResearch MCP Server", version="1.0.0")
+app = FastAPI(
+    title="DeepResearch MCP Server",
+    version="1.0.0",
+    default_response_class=ORJSONResponse if HAS_ORJSON_RESPONSE else JSONResponse,
+)
 
-# Configure CORS so that the Streamlit frontend can access the API
+# Configure CORS so that the Streamlit frontend can access the API.  An
+# explicit origin, method and header list lets browsers cache the
+# preflight response for ``max_age`` seconds.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=[
+        origin.strip() for origin in os.getenv("UI_ORIGIN", "http://localhost:8000").split(",") if origin.strip()
+    ],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    allow_credentials=False,
+    max_age=86400,
 )
 
+# Corpus statistics change only when citations are loaded, so clients
+# may reuse a response briefly
+_CORPUS_CACHE_CONTROL = "public, max-age=10"
+
+
+# Set by ``run`` once the schema exists, so that worker processes
+# (which inherit the environment) skip the per‑worker initialisation.
+_SKIP_INIT_ENV = "MCP_SKIP_INIT_DB"
+
 
 @app.on_event("startup")
 async def startup_event() -> None:
     """Initialise the database when the application starts.
 
-    This event handler runs once on server startup and ensures that the
-    database schema exists before any requests are processed.
+    This event handler runs once per worker process on server startup
+    and ensures that the database schema exists before any requests
+    are processed.  It is skipped when ``run`` has already initialised
+    the database, which avoids several workers racing to create it.
     """
-    db.init_db()
+    if os.getenv(_SKIP_INIT_ENV) != "1":
+        db.init_db()
     logger.info("MCP server startup complete")
 
 
@@ -83,14 +124,17 @@ async def health_check() -> Dict[str, Any]:
 
 
 @app.get("/corpus", response_model=Dict[str, Any])
-async def corpus_info() -> Dict[str, Any]:
+async def corpus_info(response: Response) -> Dict[str, Any]:
     """Return summary statistics about the citation corpus.
 
-    If an error occurs while computing statistics, a 500 HTTP error
-    will be returned with a corresponding message.
+    Responses carry a short ``Cache-Control`` lifetime so frequent
+    polling can be served from HTTP caches.  If an error occurs while
+    computing statistics, a 500 HTTP error will be returned with a
+    corresponding message.
     """
     try:
         stats = db.get_corpus_stats()
+        response.headers["Cache-Control"] = _CORPUS_CACHE_CONTROL
         return stats
     except Exception as e:  # pragma: no cover - just logs
         logger.error(f"Error computing corpus info: {e}")
@@ -109,9 +153,12 @@ async def search(
         query: The search string.  An empty string or ``*`` returns
             all citations up to ``limit``.
         limit: Optional maximum number of results to return.
-        mode: Search mode.  ``fulltext`` performs a simple LIKE
-            search on title and abstract.  ``semantic`` currently
-            falls back to ``fulltext``.
+        mode: Search mode.  ``fulltext`` matches every query word
+            against the title and abstract through the full‑text
+            index (FTS5 ranked by BM25 on SQLite, a ``tsvector`` GIN
+            index ranked by ``ts_rank`` on PostgreSQL), falling back
+            to a LIKE search where no index is available.
+            ``semantic`` currently falls back to ``fulltext``.
 
     Returns:
         A dictionary with a single ``results`` key containing a list
@@ -121,25 +168,7 @@ async def search(
     try:
         # Return all citations if no query provided
         if not query or query.strip() == "*":
-            citations = db.get_all_citations(limit)
-            formatted: List[Dict[str, Any]] = []
-            for c in citations:
-                snippet_source = c["abstract"] or c["title"] or ""
-                snippet = (snippet_source[:200] + "...") if len(snippet_source) > 200 else snippet_source
-                url = ""
-                cid = c["id"]
-                if cid.startswith("PMID:"):
-                    pmid = cid.replace("PMID:", "")
-                    url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
-                elif c.get("doi"):
-                    url = f"https://doi.org/{c['doi']}"
-                formatted.append({
-                    "id": cid,
-                    "title": c["title"],
-                    "text": snippet,
-                    "url": url,
-                })
-            return {"results": formatted}
+            return {"results": db.list_search_results(limit)}
         # Dispatch based on search mode
         if mode == "semantic":
             results = db.semantic_search_citations(query, limit)
@@ -174,21 +203,71 @@ async def fetch(citation_id: str) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def run(host: str = "0.0.0.0", port: int = 8001) -> None:
+# Most citations returned by one ``/fetch_bulk`` request
+_FETCH_BULK_LIMIT = 500
+
+
+class FetchBulkRequest(BaseModel):
+    """Body of a ``/fetch_bulk`` request."""
+
+    ids: List[str] = Field(..., max_length=_FETCH_BULK_LIMIT)
+
+
+@app.post("/fetch_bulk", response_model=Dict[str, Any])
+async def fetch_bulk(body: FetchBulkRequest) -> Dict[str, Any]:
+    """Retrieve the full details for several citations at once.
+
+    All citations are read with a single query, which avoids one
+    request per citation when many candidates need their abstracts.
+
+    Args:
+        body: The citation identifiers, at most ``_FETCH_BULK_LIMIT``.
+
+    Returns:
+        A dictionary with a ``citations`` list in the requested order.
+        Unknown identifiers are left out rather than raising a 404.
+    """
+    try:
+        return {"citations": db.fetch_citations_bulk(body.ids)}
+    except Exception as e:  # pragma: no cover - just logs
+        logger.error(f"Bulk fetch error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def run(host: str = "0.0.0.0", port: int = 8001, workers: Optional[int] = None) -> None:
     """Run the MCP server using uvicorn.
 
     This helper wraps uvicorn to start the application.  It is
     intended for CLI use and test convenience.  In production you may
     prefer to run uvicorn directly or under a process manager.
+
+    The database is initialised once here, before any worker starts.
+    ``workers`` defaults to the ``MCP_WORKERS`` environment variable
+    (2 if unset) so concurrent search and fetch calls from the agent
+    are served in parallel.  uvloop and httptools are used when
+    installed (``uvicorn[standard]``).  Worker processes need the
+    signal handlers of the main thread, so a server started from a
+    background thread runs a single worker.
     """
     import uvicorn  # type: ignore
 
-    logger.info(f"Starting MCP server on {host}:{port}")
-    # Suppress uvicorn access logs to reduce noise
+    if workers is None:
+        workers = int(os.getenv("MCP_WORKERS", "2"))
+    if workers > 1 and threading.current_thread() is not threading.main_thread():
+        logger.info("MCP server started outside the main thread; using a single worker")
+        workers = 1
+    db.init_db()
+    os.environ[_SKIP_INIT_ENV] = "1"
+    logger.info(f"Starting MCP server on {host}:{port} with {workers} worker(s)")
     uvicorn.run(
         "full_stack_app.backend.mcp_server:app",
         host=host,
         port=port,
+        workers=workers,
+        loop="auto",
+        http="auto",
         log_level="info",
+        # Suppress uvicorn access logs to reduce noise
+        access_log=False,
         reload=False,
-    )
\ No newline at end of file
+    )
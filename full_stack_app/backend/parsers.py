@@ -15,13 +15,14 @@ from __future__ import annotations
 
 import io
 import logging
+import os
 import re
-import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 import pandas as pd  # type: ignore
 from dateutil import parser as date_parser  # type: ignore
-from bs4 import BeautifulSoup  # type: ignore
+from lxml import etree  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -42,12 +43,36 @@ except Exception:
     HAS_LLAMA_READERS = False
 
 
+# Canonical column order of the DataFrames returned by every parser
+_CITATION_COLS = (
+    'id', 'title', 'abstract', 'year', 'authors', 'journal', 'doi', 'mesh_terms', 'keywords', 'raw_data',
+)
+
+
+def _citations_frame(citations: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Build a parser's result DataFrame from its list of citation dicts.
+
+    Passing the known column order to ``DataFrame.from_records`` skips
+    collecting the union of keys across every record, and an empty
+    input still yields the canonical columns.
+    """
+    return pd.DataFrame.from_records(citations, columns=_CITATION_COLS)
+
+
+# A four‑digit 19xx/20xx year not embedded in a longer number
+_YEAR_RE = re.compile(r'(?<!\d)(19\d{2}|20\d{2})(?!\d)')
+# Last‑resort year pattern used when dateutil raises
+_LOOSE_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+
+
 def normalize_year(date_str: Any) -> Optional[int]:
     """Coerce a variety of date representations into a four‑digit year.
 
     Returns an integer year if one can be extracted and falls within
-    1900–2100, otherwise returns ``None``.  Strings are parsed with
-    `dateutil.parser.parse` and numeric values are cast directly.
+    1900–2100, otherwise returns ``None``.  Strings containing a
+    four‑digit year are resolved with a regular expression; other
+    strings are parsed with `dateutil.parser.parse` and numeric values
+    are cast directly.
     """
     if pd.isna(date_str) or date_str in (None, ''):
         return None
@@ -55,80 +80,106 @@ def normalize_year(date_str: Any) -> Optional[int]:
         if isinstance(date_str, (int, float)):
             year = int(date_str)
             return year if 1900 <= year <= 2100 else None
+        match = _YEAR_RE.search(str(date_str))
+        if match:
+            return int(match.group(1))
         parsed = date_parser.parse(str(date_str))
         return parsed.year
     except Exception:
         # fall back to regex search for a 4‑digit year
-        match = re.search(r"\b(19|20)\d{2}\b", str(date_str))
+        match = _LOOSE_YEAR_RE.search(str(date_str))
         if match:
             return int(match.group())
     return None
 
 
 def parse_pubmed_xml(file_obj: io.BufferedIOBase) -> pd.DataFrame:
-    """Parse citations from PubMed XML export format."""
-    tree = ET.parse(file_obj)
-    root = tree.getroot()
+    """Parse citations from PubMed XML export format.
+
+    Articles are streamed with ``lxml.etree.iterparse`` and discarded
+    once read, so memory stays proportional to a single article rather
+    than the whole export.  Fields are looked up by their direct paths
+    in the PubMed DTD instead of descendant searches.
+    """
     citations: List[Dict[str, Any]] = []
-    for article in root.findall('.//PubmedArticle'):
-        pmid = article.findtext('.//PMID')
-        if not pmid:
-            continue
-        article_elem = article.find('.//Article')
-        if article_elem is None:
-            continue
-        title = article_elem.findtext('.//ArticleTitle', default='')
-        # gather abstract parts
-        abstract_parts: List[str] = []
-        abstract_elem = article_elem.find('.//Abstract')
-        if abstract_elem is not None:
-            for abstract_text in abstract_elem.findall('.//AbstractText'):
-                text_content = abstract_text.text or ''
-                label = abstract_text.get('Label', '') or ''
-                abstract_parts.append(f"{label}: {text_content}".strip() if label else text_content)
-        abstract = ' '.join(abstract_parts).strip()
-        authors: List[str] = []
-        for author in article_elem.findall('.//Author'):
-            last_name = author.findtext('LastName', default='')
-            fore_name = author.findtext('ForeName', default='')
-            if last_name:
-                authors.append(f"{last_name} {fore_name}".strip())
-        journal = article_elem.findtext('.//Journal/Title', default='')
-        pub_date = article_elem.find('.//Journal/JournalIssue/PubDate')
-        year: Optional[int] = None
-        if pub_date is not None:
-            year_text = pub_date.findtext('Year')
-            if not year_text:
-                medline_date = pub_date.findtext('MedlineDate')
-                year_text = medline_date
-            year = normalize_year(year_text)
-        doi: Optional[str] = None
-        for eloc_id in article_elem.findall('.//ELocationID'):
-            if eloc_id.get('EIdType') == 'doi':
-                doi = eloc_id.text
-                break
-        mesh_terms = [m.text for m in article.findall('.//MeshHeading/DescriptorName') if m.text]
-        keywords = [kw.text for kw in article.findall('.//Keyword') if kw.text]
-        citations.append({
-            'id': f'PMID:{pmid}',
-            'title': title,
-            'abstract': abstract,
-            'year': year,
-            'authors': authors,
-            'journal': journal,
-            'doi': doi,
-            'mesh_terms': mesh_terms,
-            'keywords': keywords,
-            'raw_data': {
-                'source': 'pubmed_xml',
-                'pmid': pmid,
-            },
-        })
-    return pd.DataFrame(citations)
+    context = etree.iterparse(file_obj, tag='PubmedArticle', huge_tree=True, resolve_entities=False)
+    for _, article in context:
+        try:
+            citation = _pubmed_article_to_citation(article)
+        finally:
+            # free the finished article and any siblings already processed
+            article.clear()
+            while article.getprevious() is not None:
+                del article.getparent()[0]
+        if citation is not None:
+            citations.append(citation)
+    return _citations_frame(citations)
+
 
+def _pubmed_article_to_citation(article: Any) -> Optional[Dict[str, Any]]:
+    """Extract a citation dictionary from a ``PubmedArticle`` element."""
+    medline = article.find('MedlineCitation')
+    if medline is None:
+        return None
+    pmid = medline.findtext('PMID')
+    if not pmid:
+        return None
+    article_elem = medline.find('Article')
+    if article_elem is None:
+        return None
+    title = article_elem.findtext('ArticleTitle', default='')
+    # gather abstract parts
+    abstract_parts: List[str] = []
+    for abstract_text in article_elem.iterfind('Abstract/AbstractText'):
+        text_content = abstract_text.text or ''
+        label = abstract_text.get('Label', '') or ''
+        abstract_parts.append(f"{label}: {text_content}".strip() if label else text_content)
+    abstract = ' '.join(abstract_parts).strip()
+    authors: List[str] = []
+    for author in article_elem.iterfind('AuthorList/Author'):
+        last_name = author.findtext('LastName', default='')
+        fore_name = author.findtext('ForeName', default='')
+        if last_name:
+            authors.append(f"{last_name} {fore_name}".strip())
+    journal = article_elem.findtext('Journal/Title', default='')
+    pub_date = article_elem.find('Journal/JournalIssue/PubDate')
+    year: Optional[int] = None
+    if pub_date is not None:
+        year_text = pub_date.findtext('Year')
+        if not year_text:
+            medline_date = pub_date.findtext('MedlineDate')
+            year_text = medline_date
+        year = normalize_year(year_text)
+    doi: Optional[str] = None
+    for eloc_id in article_elem.iterfind('ELocationID'):
+        if eloc_id.get('EIdType') == 'doi':
+            doi = eloc_id.text
+            break
+    mesh_terms = [m.text for m in medline.iterfind('MeshHeadingList/MeshHeading/DescriptorName') if m.text]
+    keywords = [kw.text for kw in medline.iterfind('KeywordList/Keyword') if kw.text]
+    return {
+        'id': f'PMID:{pmid}',
+        'title': title,
+        'abstract': abstract,
+        'year': year,
+        'authors': authors,
+        'journal': journal,
+        'doi': doi,
+        'mesh_terms': mesh_terms,
+        'keywords': keywords,
+        'raw_data': {
+            'source': 'pubmed_xml',
+            'pmid': pmid,
+        },
+    }
 
-def parse_ris(file_obj: io.TextIOBase) -> pd.DataFrame:
-    """Parse citations from RIS format using rispy."""
+
+def parse_ris(file_obj: io.TextIOBase, keep_raw: bool = False) -> pd.DataFrame:
+    """Parse citations from RIS format using rispy.
+
+    The full rispy entry duplicates every mapped field, so it is only
+    kept under ``raw_data['entry']`` when ``keep_raw`` is true.
+    """
     if not HAS_RISPY:
         raise ImportError('rispy library is required to parse RIS files')
     entries = rispy.load(file_obj)
@@ -148,149 +199,239 @@ def parse_ris(file_obj: io.TextIOBase) -> pd.DataFrame:
             'doi': entry.get('doi', ''),
             'mesh_terms': [],
             'keywords': entry.get('keywords', []),
-            'raw_data': {
-                'source': 'ris',
-                'entry': entry
-            },
+            'raw_data': {'source': 'ris', 'entry': entry} if keep_raw else {'source': 'ris'},
         })
-    return pd.DataFrame(citations)
+    return _citations_frame(citations)
+
+
+# CSV header spellings mapped to canonical column names
+_CSV_COLUMN_MAP = {
+    'pmid': 'id', 'PMID': 'id',
+    'Title': 'title', 'title': 'title',
+    'Abstract': 'abstract', 'abstract': 'abstract',
+    'Year': 'year', 'Publication Year': 'year',
+    'Authors': 'authors', 'authors': 'authors',
+    'Journal': 'journal', 'Journal/Book': 'journal', 'journal': 'journal',
+    'DOI': 'doi', 'doi': 'doi',
+    'MeSH Terms': 'mesh_terms', 'mesh_terms': 'mesh_terms',
+    'Keywords': 'keywords', 'keywords': 'keywords'
+}
+
+# Rows per DataFrame yielded by ``iter_parse_csv``
+CSV_CHUNK_SIZE = 20000
 
 
 def parse_csv(file_obj: io.TextIOBase) -> pd.DataFrame:
     """Parse a generic CSV file containing citation information."""
-    df = pd.read_csv(file_obj)
-    column_map = {
-        'pmid': 'id', 'PMID': 'id',
-        'Title': 'title', 'title': 'title',
-        'Abstract': 'abstract', 'abstract': 'abstract',
-        'Year': 'year', 'Publication Year': 'year',
-        'Authors': 'authors', 'authors': 'authors',
-        'Journal': 'journal', 'Journal/Book': 'journal', 'journal': 'journal',
-        'DOI': 'doi', 'doi': 'doi',
-        'MeSH Terms': 'mesh_terms', 'mesh_terms': 'mesh_terms',
-        'Keywords': 'keywords', 'keywords': 'keywords'
-    }
+    return _normalize_csv_frame(pd.read_csv(file_obj))
+
+
+def iter_parse_csv(file_obj: io.TextIOBase, chunksize: int = CSV_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """Parse a CSV citation file lazily, yielding ``chunksize`` rows at a time.
+
+    Each chunk is normalised exactly as by ``parse_csv``, so peak memory
+    depends on the chunk size rather than the size of the file.
+    """
+    with pd.read_csv(file_obj, chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield _normalize_csv_frame(chunk)
+
+
+def _normalize_csv_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Rename and normalise the columns of raw CSV citation rows."""
     # Rename columns to canonical names
-    df = df.rename(columns={k: v for k, v in column_map.items() if k in df.columns})
+    df = df.rename(columns={k: v for k, v in _CSV_COLUMN_MAP.items() if k in df.columns})
     # Ensure expected columns exist
     for col in ['id', 'title', 'abstract', 'year', 'authors', 'journal', 'doi', 'mesh_terms', 'keywords']:
         if col not in df.columns:
             df[col] = None
-    # Normalise authors into lists
-    def _split_authors(val: Any) -> List[str]:
-        if isinstance(val, list):
-            return val
-        if pd.isna(val) or not val:
-            return []
-        return [a.strip() for a in str(val).split(';') if a.strip()]
-    df['authors'] = df['authors'].apply(_split_authors)
-    # Normalise mesh_terms and keywords into lists
-    def _split_terms(val: Any) -> List[str]:
-        if isinstance(val, list):
-            return val
-        if pd.isna(val) or not val:
-            return []
-        return [t.strip() for t in str(val).split(';') if t.strip()]
-    df['mesh_terms'] = df['mesh_terms'].apply(_split_terms)
-    df['keywords'] = df['keywords'].apply(_split_terms)
+    # Normalise authors, MeSH terms and keywords into lists
+    for col in ('authors', 'mesh_terms', 'keywords'):
+        df[col] = _split_semicolon_lists(df[col])
     # Parse year
-    df['year'] = df['year'].apply(normalize_year)
+    df['year'] = _normalize_year_column(df['year'])
     return df
 
 
+# One ``;``‑separated item with surrounding whitespace excluded
+_LIST_ITEM_RE = re.compile(r'[^;\s](?:[^;]*[^;\s])?')
+
+
+def _split_semicolon_lists(series: pd.Series) -> pd.Series:
+    """Split ``;``‑separated cells into lists of stripped, non‑empty items.
+
+    The items are extracted with one ``str.findall`` over the column;
+    missing cells become empty lists.
+    """
+    items = series.astype('string').str.findall(_LIST_ITEM_RE)
+    return pd.Series([v if isinstance(v, list) else [] for v in items], index=series.index, dtype=object)
+
+
+def _normalize_year_column(series: pd.Series) -> pd.Series:
+    """Vectorised ``normalize_year`` over a column, as a nullable ``Int64``.
+
+    Numbers are range checked and strings are searched for a four‑digit
+    year; only strings without one are passed to ``normalize_year``.
+    """
+    numeric = pd.to_numeric(series, errors='coerce')
+    is_text = series.map(lambda v: isinstance(v, str), na_action='ignore').fillna(False).astype(bool)
+    text = series[is_text].astype('string')
+    years = numeric.where(~is_text & numeric.between(1900, 2100)).round(0).astype('Int64')
+    if is_text.any():
+        found = pd.to_numeric(text.str.extract(_YEAR_RE, expand=False), errors='coerce').astype('Int64')
+        years[is_text] = found
+        unresolved = found.isna() & (text.str.strip() != '')
+        if unresolved.any():
+            years[unresolved[unresolved].index] = [normalize_year(v) for v in text[unresolved]]
+    return years
+
+
+# Single‑valued EndNote fields; the first occurrence in a record wins
+_ENDNOTE_FIELDS = ('rec-number', 'title', 'abstract', 'year', 'secondary-title', 'electronic-resource-num')
+
+
 def parse_endnote_xml(file_obj: io.BufferedIOBase) -> pd.DataFrame:
-    """Parse citations from EndNote XML export format using BeautifulSoup."""
-    soup = BeautifulSoup(file_obj.read(), 'xml')
+    """Parse citations from EndNote XML export format.
+
+    Records are streamed with ``lxml.etree.iterparse`` and discarded
+    once read.  The parser recovers from malformed markup such as an
+    unescaped ``&``, whose broken entity is dropped from the text.  Each record is walked once, visiting only the field
+    elements of interest; values include the text of nested ``<style>``
+    elements, as EndNote wraps most values in them.
+    """
     citations: List[Dict[str, Any]] = []
-    for record in soup.find_all('record'):
-        rec_number = record.find('rec-number')
-        rec_id = f"EndNote_{rec_number.text}" if rec_number else f"EndNote_{len(citations)}"
-        title_elem = record.find('title')
-        title = title_elem.text if title_elem else ''
-        abstract_elem = record.find('abstract')
-        abstract = abstract_elem.text if abstract_elem else ''
+    for _, record in etree.iterparse(
+        file_obj, tag='record', huge_tree=True, resolve_entities=False, recover=True,
+    ):
+        fields: Dict[str, str] = {}
         authors: List[str] = []
-        contributors = record.find('contributors')
-        if contributors:
-            for author in contributors.find_all('author'):
-                if author.text:
-                    authors.append(author.text)
-        year_elem = record.find('year')
-        year = normalize_year(year_elem.text if year_elem else None)
-        journal_elem = record.find('secondary-title')
-        journal = journal_elem.text if journal_elem else ''
-        doi_elem = record.find('electronic-resource-num')
-        doi = doi_elem.text if doi_elem else ''
         keywords: List[str] = []
-        keywords_elem = record.find('keywords')
-        if keywords_elem:
-            for keyword in keywords_elem.find_all('keyword'):
-                if keyword.text:
-                    keywords.append(keyword.text)
+        for elem in record.iter(*_ENDNOTE_FIELDS, 'author', 'keyword'):
+            tag = elem.tag
+            if tag == 'author':
+                author_text = ''.join(elem.itertext())
+                if author_text and next(elem.iterancestors('contributors'), None) is not None:
+                    authors.append(author_text)
+            elif tag == 'keyword':
+                keyword_text = ''.join(elem.itertext())
+                if keyword_text and next(elem.iterancestors('keywords'), None) is not None:
+                    keywords.append(keyword_text)
+            elif tag not in fields:
+                fields[tag] = ''.join(elem.itertext())
+        rec_number = fields.get('rec-number')
+        rec_id = f"EndNote_{rec_number}" if rec_number is not None else f"EndNote_{len(citations)}"
         citations.append({
             'id': rec_id,
-            'title': title,
-            'abstract': abstract,
-            'year': year,
+            'title': fields.get('title', ''),
+            'abstract': fields.get('abstract', ''),
+            'year': normalize_year(fields.get('year')),
             'authors': authors,
-            'journal': journal,
-            'doi': doi,
+            'journal': fields.get('secondary-title', ''),
+            'doi': fields.get('electronic-resource-num', ''),
             'mesh_terms': [],
             'keywords': keywords,
             'raw_data': {
                 'source': 'endnote_xml',
             },
         })
-    return pd.DataFrame(citations)
+        # free the finished record and any siblings already processed
+        record.clear()
+        while record.getprevious() is not None:
+            del record.getparent()[0]
+    return _citations_frame(citations)
+
+
+# One MEDLINE field: a ``TAG - value`` line plus any indented
+# continuation lines.  Only the tags read by ``_medline_to_citation`` are
+# matched, so other fields are skipped inside the regex engine.
+# Anchoring on a literal newline rather than ``^`` lets the regex engine
+# jump between line starts.
+_MEDLINE_FIELD_RE = re.compile(r'\n(PMID|TI|AB|FAU|TA|DP|MH|LID) *- ?([^\n]*(?:\n[ \t]+[^\n]*)*)')
+_LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+_DIGITS_RE = re.compile(r'\d+')
+_DP_YEAR_RE = re.compile(r'\d{4}')
+_LID_DOI_RE = re.compile(r'(10\.\S+)\s*\[doi\]', re.IGNORECASE)
 
 
 def parse_pubmed_text(file_obj: io.BufferedIOBase) -> pd.DataFrame:
-    """Parse citations from PubMed MEDLINE text (NBIB) export format."""
+    """Parse citations from PubMed MEDLINE text (NBIB) export format.
+
+    The export is scanned once for the tagged fields that are used,
+    each with its indented continuation lines; a ``PMID`` tag starts a
+    new record.
+    """
     content = file_obj.read().decode('utf-8', errors='ignore')
-    entries = re.split(r'\n(?=PMID-)', content)
     citations: List[Dict[str, Any]] = []
-    for entry in entries:
-        if not entry.strip():
-            continue
-        lines = entry.strip().split('\n')
-        if not lines:
-            continue
-        citation: Dict[str, Any] = {
-            'id': '', 'title': '', 'abstract': '', 'year': None,
-            'authors': [], 'journal': '', 'doi': '',
-            'mesh_terms': [], 'keywords': [],
-            'raw_data': {'source': 'pubmed_text'}
-        }
-        full_text = '\n'.join(lines)
-        pmid_match = re.search(r'PMID-\s*(\d+)', full_text)
-        if pmid_match:
-            citation['id'] = f"PMID:{pmid_match.group(1)}"
-        doi_match = re.search(r'LID\s*-\s*(10\.\S+)\s*\[doi\]', full_text, re.IGNORECASE)
-        if doi_match:
-            citation['doi'] = doi_match.group(1)
-        title_match = re.search(r'TI\s*-\s*(.+?)(?=\n[A-Z]{2}\s*-)', full_text, re.DOTALL)
-        if title_match:
-            citation['title'] = title_match.group(1).strip().replace('\n', ' ')
-        abstract_match = re.search(r'AB\s*-\s*(.+?)(?=\n[A-Z]{2}\s*-)', full_text, re.DOTALL)
-        if abstract_match:
-            citation['abstract'] = abstract_match.group(1).strip().replace('\n', ' ')
-        authors = re.findall(r'FAU\s*-\s*(.+)', full_text)
-        citation['authors'] = [a.strip() for a in authors]
-        journal_match = re.search(r'TA\s*-\s*(.+)', full_text)
-        if journal_match:
-            citation['journal'] = journal_match.group(1).strip()
-        date_match = re.search(r'DP\s*-\s*(\d{4})', full_text)
-        if date_match:
-            citation['year'] = int(date_match.group(1))
-        mesh_terms = [m.strip() for m in re.findall(r'MH\s*-\s*([^\n]+)', full_text)]
-        citation['mesh_terms'] = mesh_terms
+    fields: Dict[str, List[str]] = {}
+    for tag, value in _MEDLINE_FIELD_RE.findall('\n' + content):
+        if tag == 'PMID' and fields:
+            citation = _medline_to_citation(fields)
+            if citation['id'] or citation['title']:
+                citations.append(citation)
+            fields = {}
+        if '\n' in value:
+            value = _LINE_BREAK_RE.sub(' ', value)
+        fields.setdefault(tag, []).append(value.strip())
+    if fields:
+        citation = _medline_to_citation(fields)
         if citation['id'] or citation['title']:
             citations.append(citation)
-    return pd.DataFrame(citations)
+    return _citations_frame(citations)
+
+
+def _medline_to_citation(fields: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Build a citation dictionary from the tagged fields of one record."""
+    def first(tag: str) -> str:
+        values = fields.get(tag)
+        return values[0] if values else ''
+
+    citation: Dict[str, Any] = {
+        'id': '', 'title': first('TI'), 'abstract': first('AB'), 'year': None,
+        'authors': fields.get('FAU', []), 'journal': first('TA'), 'doi': '',
+        'mesh_terms': fields.get('MH', []), 'keywords': [],
+        'raw_data': {'source': 'pubmed_text'}
+    }
+    pmid_match = _DIGITS_RE.match(first('PMID'))
+    if pmid_match:
+        citation['id'] = f"PMID:{pmid_match.group()}"
+    for lid in fields.get('LID', []):
+        doi_match = _LID_DOI_RE.match(lid)
+        if doi_match:
+            citation['doi'] = doi_match.group(1)
+            break
+    date_match = _DP_YEAR_RE.match(first('DP'))
+    if date_match:
+        citation['year'] = int(date_match.group())
+    return citation
+
+
+# Field prefixes that identify a ``.txt`` file as a MEDLINE export
+_MEDLINE_PREFIX_RE = re.compile(rb'PMID[:-]|TI  -|AB  -|FAU  -|AU  -|LID  -|DP  -')
+
+# Content signatures of each format, matched case‑insensitively on raw bytes
+_FORMAT_RE = re.compile(
+    rb'(?P<ris>ty  -)|(?P<pubmed_xml><pubmedarticle)|(?P<endnote_xml><record)|(?P<pubmed_text>\Apmid-|pmid:)',
+    re.IGNORECASE,
+)
+
+# Formats in the order they win when several signatures are present
+_FORMAT_PRIORITY = ('ris', 'pubmed_xml', 'endnote_xml', 'pubmed_text')
+
+# Bytes of content inspected by the signature heuristics
+_SNIPPET_BYTES = 2000
+
+
+def _format_signatures(content: bytes) -> Set[str]:
+    """Return the names of the formats whose signatures occur in ``content``."""
+    return {match.lastgroup for match in _FORMAT_RE.finditer(content)}
 
 
 def detect_format(filename: str, content: bytes) -> str:
-    """Attempt to detect the citation file format based on filename and content."""
+    """Attempt to detect the citation file format based on filename and content.
+
+    Content is matched as bytes against one combined signature regex,
+    so no decoding or lower‑casing of the upload is needed.
+    """
     filename_lower = filename.lower()
     # extension based detection
     if filename_lower.endswith('.ris'):
@@ -300,42 +441,64 @@ def detect_format(filename: str, content: bytes) -> str:
     if filename_lower.endswith('.nbib'):
         return 'pubmed_text'
     if filename_lower.endswith('.xml'):
-        content_str = content.decode('utf-8', errors='ignore')
-        lower = content_str.lower()
-        if '<pubmedarticle' in lower:
+        found = _format_signatures(content)
+        if 'pubmed_xml' in found:
             return 'pubmed_xml'
-        if '<record' in lower or '<records' in lower:
+        if 'endnote_xml' in found:
             return 'endnote_xml'
         return 'unknown_xml'
     if filename_lower.endswith('.txt'):
-        snippet = content.decode('utf-8', errors='ignore')[:2000]
-        if any(prefix in snippet for prefix in ['PMID:', 'PMID-', 'TI  -', 'AB  -', 'FAU  -', 'AU  -', 'LID  -', 'DP  -']):
+        if _MEDLINE_PREFIX_RE.search(content, 0, _SNIPPET_BYTES):
             return 'pubmed_text'
     # content heuristics
-    snippet = content.decode('utf-8', errors='ignore')[:2000].lower()
-    if 'ty  -' in snippet:
-        return 'ris'
-    if '<pubmedarticle' in snippet:
-        return 'pubmed_xml'
-    if '<record' in snippet or '<records' in snippet:
-        return 'endnote_xml'
-    if snippet.startswith('pmid-') or 'pmid:' in snippet:
-        return 'pubmed_text'
+    found = _format_signatures(content[:_SNIPPET_BYTES])
+    for fmt in _FORMAT_PRIORITY:
+        if fmt in found:
+            return fmt
     return 'unknown'
 
 
-def parse_citations(file_obj: io.BufferedIOBase, filename: str) -> pd.DataFrame:
-    """Detect the format of a citation file and dispatch to the proper parser."""
-    content = file_obj.read()
-    file_format = detect_format(filename, content)
-    # Reset file pointer to allow reading again
-    file_obj = io.BytesIO(content)
+# Bytes read from the start of an upload to detect its format
+_SNIFF_BYTES = 4096
+
+
+def _sniff(file_obj: io.BufferedIOBase, filename: str) -> Tuple[str, io.BufferedIOBase]:
+    """Detect the format of an upload and return it with the rewound file.
+
+    Only the first few kilobytes are read for detection; the file is
+    then rewound, so the content is not copied into a second buffer.
+    Non‑seekable inputs are buffered in memory.
+    """
+    head = file_obj.read(_SNIFF_BYTES)
+    file_format = detect_format(filename, head)
+    try:
+        file_obj.seek(0)
+    except (AttributeError, OSError):
+        file_obj = io.BytesIO(head + file_obj.read())
+    return file_format, file_obj
+
+
+def parse_citations(file_obj: io.BufferedIOBase, filename: str, keep_raw: bool = False) -> pd.DataFrame:
+    """Detect the format of a citation file and dispatch to the proper parser.
+
+    ``keep_raw`` is passed to parsers that can retain the original
+    source record.
+    """
+    file_format, file_obj = _sniff(file_obj, filename)
+    return _parse_detected(file_obj, file_format, keep_raw)
+
+
+def _parse_detected(file_obj: io.BufferedIOBase, file_format: str, keep_raw: bool) -> pd.DataFrame:
+    """Parse a rewound upload whose format has already been detected."""
     if file_format == 'pubmed_xml':
         return parse_pubmed_xml(file_obj)
-    if file_format == 'ris':
-        return parse_ris(io.StringIO(content.decode('utf-8', errors='ignore')))
-    if file_format == 'csv':
-        return parse_csv(io.StringIO(content.decode('utf-8', errors='ignore')))
+    if file_format in ('ris', 'csv'):
+        text_obj = io.TextIOWrapper(file_obj, encoding='utf-8', errors='ignore', newline='')
+        try:
+            return parse_ris(text_obj, keep_raw=keep_raw) if file_format == 'ris' else parse_csv(text_obj)
+        finally:
+            # leave the caller's file open
+            text_obj.detach()
     if file_format == 'endnote_xml':
         return parse_endnote_xml(file_obj)
     if file_format == 'pubmed_text':
@@ -343,6 +506,59 @@ def parse_citations(file_obj: io.BufferedIOBase, filename: str) -> pd.DataFrame:
     raise ValueError(f"Unsupported file format: {file_format}")
 
 
+def parse_citations_batch(
+    files: Sequence[Tuple[io.BufferedIOBase, str]],
+    max_workers: Optional[int] = None,
+    keep_raw: bool = False,
+) -> pd.DataFrame:
+    """Parse several ``(file_obj, filename)`` uploads into one DataFrame.
+
+    Files are parsed concurrently in a thread pool; lxml and the pandas
+    CSV reader release the GIL while parsing, so the work overlaps.
+    Rows keep the order of ``files``.
+    """
+    if not files:
+        return _citations_frame([])
+    workers = max_workers or min(len(files), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        frames = list(executor.map(lambda f: parse_citations(f[0], f[1], keep_raw=keep_raw), files))
+    return pd.concat(frames, ignore_index=True)
+
+
+def iter_parse_citations_batch(
+    files: Sequence[Tuple[io.BufferedIOBase, str]],
+    chunksize: int = CSV_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+    keep_raw: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """Parse several uploads lazily, yielding DataFrames in file order.
+
+    CSV files are read in chunks of ``chunksize`` rows so arbitrarily
+    large exports never sit in memory as a whole.  Other formats are
+    parsed into one frame per file in a background thread pool while
+    earlier files are being consumed.
+    """
+    sniffed = [_sniff(file_obj, filename) for file_obj, filename in files]
+    if not sniffed:
+        return
+    workers = max_workers or min(len(sniffed), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = [
+            None if file_format == 'csv' else executor.submit(_parse_detected, file_obj, file_format, keep_raw)
+            for file_format, file_obj in sniffed
+        ]
+        for (file_format, file_obj), future in zip(sniffed, pending):
+            if future is not None:
+                yield future.result()
+                continue
+            text_obj = io.TextIOWrapper(file_obj, encoding='utf-8', errors='ignore', newline='')
+            try:
+                yield from iter_parse_csv(text_obj, chunksize)
+            finally:
+                # leave the caller's file open
+                text_obj.detach()
+
+
 def parse_arxiv_search(search_query: str, max_results: int = 10) -> pd.DataFrame:
     """Fetch papers from ArXiv using the llama_index ArxivReader."""
     if not HAS_LLAMA_READERS:
@@ -369,7 +585,7 @@ def parse_arxiv_search(search_query: str, max_results: int = 10) -> pd.DataFrame
             'keywords': metadata.get('categories', '').split() if metadata.get('categories') else [],
             'raw_data': metadata
         })
-    return pd.DataFrame(citations)
+    return _citations_frame(citations)
 
 
 def parse_pubmed_search(search_query: str, max_results: int = 10) -> pd.DataFrame:
@@ -396,4 +612,4 @@ def parse_pubmed_search(search_query: str, max_results: int = 10) -> pd.DataFram
             'keywords': metadata.get('Keywords', '').split(';') if metadata.get('Keywords') else [],
             'raw_data': metadata
         })
-    return pd.DataFrame(citations)
+    return _citations_frame(citations)
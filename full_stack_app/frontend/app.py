@@ -19,8 +19,10 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 import streamlit as st  # type: ignore
 
@@ -32,6 +34,32 @@ from full_stack_app.backend import (
     ice_critic,
 )
 
+# Decode screening responses with orjson when it is installed
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
+
+# Workflow steps in order, with their sidebar labels
+_STEPS = ("upload", "criteria", "results")
+_STEP_NAMES = {
+    "upload": "1. Upload",
+    "criteria": "2. Criteria",
+    "results": "3. Results",
+}
+_STEP_ORDER = {step: position for position, step in enumerate(_STEPS)}
+
+# PICOTT fields collected by the criteria form
+_PICO_FIELDS = ("population", "intervention", "comparator", "outcome", "timeframe", "study_type")
+
+# Streamed decisions received between repaints of the partial results table
+_STREAM_REFRESH_EVERY = 5
+
+# Nested result fields left out of the decisions table
+_RESULT_HIDE = frozenset({"picott", "inclusionCriteria", "exclusionCriteria", "reasoning"})
+
 
 def _reset_session() -> None:
     """Initialise default values in the Streamlit session state.
@@ -40,24 +68,32 @@ def _reset_session() -> None:
     """
     state_defaults = {
         "step": "upload",  # current UI step
-        "citations_df": None,  # DataFrame of loaded citations
+        "citation_count": 0,  # Rows loaded by the last upload
         "validation_report": None,  # Report from data validation
         "criteria": {},  # PICOTT and custom criteria
         "screening_results": None,  # Raw results from Deep Research
+        "results_view": None,  # Table, counts and CSV built from the results
         "analysis": None,  # ICE critic analysis of screening results
+        "analysis_future": None,  # Pending ICE critic analysis
     }
     for key, default in state_defaults.items():
         if key not in st.session_state:
             st.session_state[key] = default
+    # One validator per browser session; it is stateful, so it must not
+    # be shared between sessions through ``st.cache_resource``
+    if "validator" not in st.session_state:
+        st.session_state.validator = data_validator.CitationValidator()
 
 
 def show_upload_step() -> None:
     """Display the citation upload step.
 
-    Users can upload a file in PubMed XML, RIS, CSV, EndNote XML or
-    plain text format.  The file is parsed into a DataFrame using
-    ``parsers.parse_citations`` and then inserted into the database.
-    A validation report is shown to highlight data quality issues.
+    Users can upload one or more files in PubMed XML, RIS, CSV, EndNote
+    XML or plain text format.  The files are parsed lazily with
+    ``parsers.iter_parse_citations_batch`` and each chunk is validated
+    and inserted into the database as it arrives, with a progress bar
+    tracking the bytes read.  A validation report is shown to highlight
+    data quality issues.
     """
     st.header("Step 1 – Load citations")
     st.write(
@@ -65,33 +101,49 @@ def show_upload_step() -> None:
         "EndNote XML and plain text.  The parser will automatically detect the format."
     )
     uploaded = st.file_uploader(
-        "Choose a citation file",
+        "Choose citation files",
         type=["xml", "ris", "csv", "nbib", "txt"],
+        accept_multiple_files=True,
         help="Upload your exported citations from reference management software",
     )
     if uploaded:
-        st.info(f"File uploaded: {uploaded.name} ({uploaded.size:,} bytes)")
+        for upload in uploaded:
+            st.info(f"File uploaded: {upload.name} ({upload.size:,} bytes)")
         if st.button("Parse and load", type="primary"):
-            with st.spinner("Parsing citations…"):
-                try:
-                    df = parsers.parse_citations(uploaded, uploaded.name)
-                    st.session_state.citations_df = df
-                    # Validate citations
-                    validator = data_validator.CitationValidator()
-                    validated_df, report = validator.validate_citations(df)
-                    st.session_state.validation_report = report
-                    # Insert into database
-                    db.init_db()
-                    stats = db.bulk_insert_citations(validated_df)
-                    st.success(
-                        f"Loaded {stats['inserted'] + stats['updated']} citations into the database."
-                    )
-                    if stats["skipped"]:
-                        st.warning(f"Skipped {stats['skipped']} rows without IDs.")
-                    # Move to next step
-                    st.session_state.step = "criteria"
-                except Exception as e:
-                    st.error(f"Error parsing file: {e}")
+            total_bytes = sum(upload.size for upload in uploaded) or 1
+            progress = st.progress(0.0, text="Parsing citations…")
+            validator = st.session_state.validator
+            validator.reset()
+
+            def validated_chunks() -> Iterator[pd.DataFrame]:
+                # Parse, validate and insert chunk by chunk so large CSV
+                # exports are never held in memory as a whole.
+                rows = 0
+                chunks = parsers.iter_parse_citations_batch([(upload, upload.name) for upload in uploaded])
+                for chunk in chunks:
+                    validated_df, _ = validator.validate_citations(chunk)
+                    rows += len(chunk)
+                    yield validated_df
+                    read = sum(upload.tell() for upload in uploaded)
+                    progress.progress(min(read / total_bytes, 1.0), text=f"Loaded {rows:,} citations…")
+
+            try:
+                # Insert into database
+                db.init_db()
+                stats = db.bulk_insert_citations_fast(validated_chunks())
+                progress.progress(1.0, text="Done")
+                st.session_state.validation_report = validator.generate_validation_report()
+                st.session_state.citation_count = stats["total"]
+                st.success(
+                    f"Loaded {stats['inserted'] + stats['updated']} citations into the database."
+                )
+                if stats["skipped"]:
+                    st.warning(f"Skipped {stats['skipped']} rows without IDs.")
+                # Move to next step
+                st.session_state.step = "criteria"
+            except Exception as e:
+                progress.empty()
+                st.error(f"Error parsing file: {e}")
         # Display validation report if available
         if st.session_state.validation_report:
             report = st.session_state.validation_report
@@ -144,41 +196,95 @@ def show_criteria_step() -> None:
             "inclusion": [c.strip() for c in incl_text.splitlines() if c.strip()],
             "exclusion": [c.strip() for c in excl_text.splitlines() if c.strip()],
         }
-        # Launch screening job
-        with st.spinner("Launching AI screening… this may take several minutes"):
-            try:
-                # Determine MCP URL; fall back to localhost
-                mcp_url = os.getenv("MCP_URL", "http://localhost:8001") + "/sse/"
-                response = deep_research.launch_screening_job(
-                    pico_criteria={
-                        "population": pop.strip() or "Not specified",
-                        "intervention": interv.strip() or "Not specified",
-                        "comparator": comp.strip() or "Not specified",
-                        "outcome": outcome.strip() or "Not specified",
-                        "timeframe": timeframe.strip() or "Not specified",
-                        "study_type": study_type.strip() or "Not specified",
-                    },
-                    inclusion_criteria=[c.strip() for c in incl_text.splitlines() if c.strip()],
-                    exclusion_criteria=[c.strip() for c in excl_text.splitlines() if c.strip()],
-                    corpus_size=len(st.session_state.citations_df) if st.session_state.citations_df is not None else 0,
-                    mcp_url=mcp_url,
-                )
-                # Poll for completion
-                result = deep_research.poll_job_status(response)
-                # The content is expected to be a JSON array
-                content = result.get("content", "")
-                try:
-                    screening_results = json.loads(content)
-                except json.JSONDecodeError:
-                    st.error("Failed to parse AI response. Raw content shown below.")
-                    st.code(content)
-                    return
-                st.session_state.screening_results = screening_results
-                st.session_state.step = "results"
-            except Exception as e:
-                st.error(
-                    f"Screening failed: {e}. Ensure your OPENAI_API_KEY is set and that the MCP server is reachable."
-                )
+        criteria = st.session_state.criteria
+        job = {
+            "pico_criteria": {key: criteria[key] for key in _PICO_FIELDS},
+            "inclusion_criteria": criteria["inclusion"],
+            "exclusion_criteria": criteria["exclusion"],
+            "corpus_size": st.session_state.citation_count,
+            # Determine MCP URL; fall back to localhost
+            "mcp_url": os.getenv("MCP_URL", "http://localhost:8001") + "/sse/",
+        }
+        try:
+            if os.getenv("USE_SSE", "1") == "0":
+                screening_results = _run_screening_blocking(job)
+            else:
+                screening_results = _run_screening_streaming(job)
+        except Exception as e:
+            st.error(
+                f"Screening failed: {e}. Ensure your OPENAI_API_KEY is set and that the MCP server is reachable."
+            )
+            return
+        if screening_results is None:
+            return
+        st.session_state.screening_results = screening_results
+        st.session_state.results_view = None
+        st.session_state.analysis = None
+        st.session_state.analysis_future = None
+        st.session_state.step = "results"
+
+
+def _run_screening_blocking(job: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """Run a screening job and wait for the complete response.
+
+    Returns the parsed decisions, or ``None`` after reporting a response
+    that is not valid JSON.
+    """
+    with st.spinner("Launching AI screening… this may take several minutes"):
+        # Queue the job in the background and poll for completion with
+        # backoff rather than holding one request open for minutes
+        response = deep_research.launch_screening_job(**job, background=True)
+        result = deep_research.poll_job_status(response)
+    content = result.get("content", "")
+    decisions = _parse_decisions(content)
+    if decisions is None:
+        st.error("Failed to parse AI response. Raw content shown below.")
+        st.code(content)
+    return decisions
+
+
+def _parse_decisions(content: str) -> Optional[List[Dict[str, Any]]]:
+    """Parse the complete response text, expected to be a JSON array."""
+    try:
+        return orjson.loads(content) if HAS_ORJSON else json.loads(content)
+    except ValueError:  # the JSONDecodeError of either library
+        return None
+
+
+def _run_screening_streaming(job: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """Run a screening job, showing decisions as the model streams them.
+
+    The decision table is repainted every ``_STREAM_REFRESH_EVERY``
+    decisions rather than on every event.  Returns ``None`` after
+    reporting a response without any decisions.
+    """
+    status = st.empty()
+    table = st.empty()
+    status.info("Launching AI screening… decisions will appear below as they are made")
+    decisions: List[Dict[str, Any]] = []
+    stream = deep_research.stream_screening_job(**job)
+    for decision in stream:
+        decisions.append(decision)
+        if len(decisions) % _STREAM_REFRESH_EVERY == 0:
+            status.info(f"Screened {len(decisions)} citations so far…")
+            table.dataframe(_decision_table(decisions), use_container_width=True)
+    status.empty()
+    table.empty()
+    if not decisions:
+        # Fall back to parsing the whole response, as the blocking path does
+        parsed = _parse_decisions(stream.content)
+        if parsed:
+            return parsed
+        st.error("Failed to parse AI response. Raw content shown below.")
+        st.code(stream.content)
+        return None
+    return decisions
+
+
+def _decision_table(decisions: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Return the compact columns of the decisions shown while streaming."""
+    df = pd.DataFrame(decisions)
+    return df[[col for col in ("id", "title", "decision", "confidence") if col in df.columns]]
 
 
 def show_results_step() -> None:
@@ -188,45 +294,95 @@ def show_results_step() -> None:
     if not results:
         st.error("No screening results available. Please run the screening first.")
         return
-    # Display decisions in a table
-    df = pd.DataFrame(results)
-    # Flatten decision fields for display
-    if "decision" in df.columns:
-        df["decision"] = df["decision"].astype(str)
-    if "confidence" in df.columns:
-        df["confidence"] = df["confidence"].astype(str)
+    # Start the consistency analysis first so it runs while the table
+    # is rendered; the result is kept for later reruns
+    if st.session_state.analysis is None and st.session_state.analysis_future is None:
+        st.session_state.analysis_future = _analysis_executor().submit(
+            ice_critic.analyze_screening_consistency,
+            screening_results=results,
+            pico_criteria=st.session_state.criteria,
+        )
+    # The table, counts and CSV only change with the results, so they
+    # are built once and reused on every rerun
+    if st.session_state.results_view is None:
+        st.session_state.results_view = _build_results_view(results)
+    table, include_count, exclude_count, csv_data = st.session_state.results_view
     st.subheader("AI screening decisions")
-    st.dataframe(
-        df[[col for col in df.columns if col not in {"picott", "inclusionCriteria", "exclusionCriteria", "reasoning"}]],
-        use_container_width=True,
-    )
-    # Summary statistics
-    include_count = df[df.get("decision", "").str.lower() == "include"].shape[0]
-    exclude_count = df[df.get("decision", "").str.lower() == "exclude"].shape[0]
+    st.dataframe(table, use_container_width=True)
     st.write(f"Included citations: {include_count}\n\nExcluded citations: {exclude_count}")
-    # Perform ICE analysis
-    try:
-        analysis = ice_critic.analyze_screening_consistency(
-            screening_results=results, pico_criteria=st.session_state.criteria
-        )
-        st.session_state.analysis = analysis
-        st.subheader("Consistency analysis")
-        st.write(f"Total issues detected: {analysis['summary']['total_issues']}")
-        if analysis["issues"]:
-            for issue in analysis["issues"]:
-                st.warning(
-                    f"{issue['type']}: {issue['description']} (severity: {issue['severity']})"
-                )
-    except Exception as e:
-        st.error(f"Failed to analyse screening consistency: {e}")
     # Offer export
-    csv_data = df.to_csv(index=False).encode("utf-8")
     st.download_button(
         label="Download results as CSV",
         data=csv_data,
         file_name="screening_results.csv",
         mime="text/csv",
     )
+    # The elements above are already on the page; fill in the analysis
+    # section once the background job finishes
+    placeholder = st.empty()
+    if st.session_state.analysis is None:
+        placeholder.info("Analysing screening consistency…")
+        # A rerun that interrupts this wait picks up the same future
+        future: Future = st.session_state.analysis_future
+        try:
+            analysis = future.result()
+        except Exception as e:
+            # Drop the failed future so the next rerun tries again
+            st.session_state.analysis_future = None
+            placeholder.error(f"Failed to analyse screening consistency: {e}")
+            return
+        st.session_state.analysis = analysis
+        st.session_state.analysis_future = None
+    analysis = st.session_state.analysis
+    with placeholder.container():
+        st.subheader("Consistency analysis")
+        st.write(f"Total issues detected: {analysis['summary']['total_issues']}")
+        for issue in analysis["issues"]:
+            st.warning(
+                f"{issue['type']}: {issue['description']} (severity: {issue['severity']})"
+            )
+
+
+@st.cache_resource
+def _analysis_executor() -> ThreadPoolExecutor:
+    """Return the worker pool, shared by all sessions, for consistency analyses."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="ice-critic")
+
+
+def _build_results_view(results: List[Dict[str, Any]]) -> Tuple[pd.DataFrame, int, int, bytes]:
+    """Prepare the results table, include/exclude counts and CSV export.
+
+    Returns ``(table, include_count, exclude_count, csv_bytes)``; the
+    table omits the nested fields listed in ``_RESULT_HIDE`` while the
+    CSV keeps every column.
+    """
+    df = pd.DataFrame(results)
+    # Flatten decision fields for display
+    if "decision" in df.columns:
+        df["decision"] = df["decision"].astype(str)
+    if "confidence" in df.columns:
+        df["confidence"] = df["confidence"].astype(str)
+    # Summary statistics from one lower‑cased pass over the decisions
+    decisions = df["decision"].str.lower().to_numpy() if "decision" in df.columns else np.empty(0, dtype=object)
+    include_count = int(np.count_nonzero(decisions == "include"))
+    exclude_count = int(np.count_nonzero(decisions == "exclude"))
+    table = df[[col for col in df.columns if col not in _RESULT_HIDE]]
+    return table, include_count, exclude_count, df.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_corpus_stats(version: int) -> Tuple[int, Optional[pd.Series]]:
+    """Return the corpus size and per‑year counts for the sidebar.
+
+    Cached per ``db.get_corpus_version()`` so reruns skip the aggregate
+    queries until citations are loaded again; the TTL picks up writes
+    made by other processes.
+    """
+    stats = db.get_corpus_stats()
+    year_counts = None
+    if stats["year_distribution"]:
+        year_counts = pd.DataFrame(stats["year_distribution"]).set_index("year")["count"]
+    return stats["total_citations"], year_counts
 
 
 def main() -> None:
@@ -240,29 +396,21 @@ def main() -> None:
     # Sidebar navigation
     with st.sidebar:
         st.title("Navigation")
-        steps = ["upload", "criteria", "results"]
-        names = {
-            "upload": "1. Upload",
-            "criteria": "2. Criteria",
-            "results": "3. Results",
-        }
-        current_step = st.session_state.step
-        for step in steps:
-            if step == current_step:
-                st.success(f"→ {names[step]}")
-            elif steps.index(step) < steps.index(current_step):
-                st.info(f"✓ {names[step]}")
+        current = _STEP_ORDER[st.session_state.step]
+        for position, step in enumerate(_STEPS):
+            if position == current:
+                st.success(f"→ {_STEP_NAMES[step]}")
+            elif position < current:
+                st.info(f"✓ {_STEP_NAMES[step]}")
             else:
-                st.text(names[step])
+                st.text(_STEP_NAMES[step])
         st.divider()
         # Show corpus stats if citations are loaded
-        if st.session_state.citations_df is not None:
-            stats = db.get_corpus_stats()
-            st.metric("Citations", stats["total_citations"])
-            if stats["year_distribution"]:
-                year_df = pd.DataFrame(stats["year_distribution"])
-                if not year_df.empty:
-                    st.bar_chart(year_df.set_index("year")["count"])
+        if st.session_state.citation_count:
+            total, year_counts = _cached_corpus_stats(db.get_corpus_version())
+            st.metric("Citations", total)
+            if year_counts is not None:
+                st.bar_chart(year_counts)
     # Main content area
     if st.session_state.step == "upload":
         show_upload_step()
@@ -13,8 +13,9 @@ python -m full_stack_app.frontend.main [server|ui|both]
 ```
 
 If no argument is provided, the default is ``both`` which will start
-the MCP server on port 8001 in a background thread and then launch
-the Streamlit UI on port 8000.  The server is started without
+the MCP server on port 8001 in a background thread, wait for its
+``/health`` endpoint to respond and then launch the Streamlit UI on
+port 8000.  The server is started without
 auto‑reloading.
 """
 
@@ -24,6 +25,7 @@ import subprocess
 import sys
 import threading
 import time
+import urllib.request
 from pathlib import Path
 
 
@@ -52,13 +54,34 @@ def run_ui() -> None:
     ])
 
 
+def _wait_healthy(url: str = "http://127.0.0.1:8001/health", timeout: float = 5.0) -> bool:
+    """Poll the server health endpoint until it answers or ``timeout`` passes.
+
+    Retries back off exponentially from 10 ms up to 200 ms between
+    attempts.  Returns True once the endpoint responds with HTTP 200.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=0.2) as response:
+                if response.status == 200:
+                    return True
+        except OSError:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
+    return False
+
+
 def run_both() -> None:
     """Start the MCP server in a background thread and then launch the UI."""
     # Start server thread as daemon so it terminates when the main program exits
     server_thread = threading.Thread(target=run_server, daemon=True)
     server_thread.start()
-    # Give the server a moment to start up
-    time.sleep(2)
+    # Wait until the server answers health checks rather than a fixed delay
+    if not _wait_healthy():
+        print("MCP server did not become healthy within 5 seconds; starting the UI anyway")
     # Launch the Streamlit UI in the main thread
     run_ui()
 
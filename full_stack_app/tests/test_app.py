@@ -11,13 +11,15 @@ isolation, and environment variables are manipulated as needed.
 from __future__ import annotations
 
 import importlib
-import os
+import io
 import json
 from io import StringIO
 
 import pandas as pd  # type: ignore
+import pytest
+from sqlalchemy import text
 
-from full_stack_app.backend import parsers, data_validator, ice_critic
+from full_stack_app.backend import database as db, parsers, data_validator, ice_critic
 
 
 def test_parse_csv_and_database_operations() -> None:
@@ -31,10 +33,7 @@ PMID:67890,Another Title,Another abstract.,2019,"Brown B",Journal B,,"research"
     df = parsers.parse_csv(csv_file)
     assert len(df) == 2
     # Configure an in‑memory database for isolation
-    os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
-    # Reload the database module to pick up the new environment
-    from full_stack_app.backend import database as db  # type: ignore
-    importlib.reload(db)
+    db.configure('sqlite:///:memory:')
     db.init_db()
     stats = db.bulk_insert_citations(df)
     assert stats['inserted'] == 2
@@ -52,6 +51,119 @@ PMID:67890,Another Title,Another abstract.,2019,"Brown B",Journal B,,"research"
     assert years == {2019, 2020}
 
 
+def test_parse_pubmed_xml_streams_articles() -> None:
+    """PubMed XML articles are parsed from their direct element paths."""
+    xml = b"""<?xml version="1.0"?>
+<PubmedArticleSet>
+<PubmedArticle><MedlineCitation><PMID>111</PMID><Article>
+<Journal><Title>Journal A</Title><JournalIssue><PubDate><Year>2020</Year></PubDate></JournalIssue></Journal>
+<ArticleTitle>First trial</ArticleTitle>
+<ELocationID EIdType="doi">10.1000/a</ELocationID>
+<Abstract><AbstractText Label="METHODS">Randomised.</AbstractText><AbstractText>Done.</AbstractText></Abstract>
+<AuthorList><Author><LastName>Doe</LastName><ForeName>Jane</ForeName></Author></AuthorList>
+</Article>
+<MeshHeadingList><MeshHeading><DescriptorName>Humans</DescriptorName></MeshHeading></MeshHeadingList>
+</MedlineCitation></PubmedArticle>
+<PubmedArticle><MedlineCitation><PMID>222</PMID><Article><ArticleTitle>Second</ArticleTitle></Article></MedlineCitation></PubmedArticle>
+</PubmedArticleSet>"""
+    df = parsers.parse_citations(io.BytesIO(xml), 'export.xml')
+    assert list(df['id']) == ['PMID:111', 'PMID:222']
+    first = df.iloc[0]
+    assert first['abstract'] == 'METHODS: Randomised. Done.'
+    assert (first['year'], first['doi'], first['authors'], first['mesh_terms']) == (2020, '10.1000/a', ['Doe Jane'], ['Humans'])
+
+
+def test_parse_endnote_xml_recovers_from_malformed_records() -> None:
+    """A bare ``&`` in one record does not stop the rest of the export parsing."""
+    export = (
+        b'<xml><records>'
+        b'<record><rec-number>1</rec-number><titles><title><style>Diet &amp exercise</style></title></titles>'
+        b'<contributors><authors><author>Smith, J</author></authors></contributors></record>'
+        b'<record><rec-number>2</rec-number><titles><title>Second study</title></titles></record>'
+        b'</records></xml>'
+    )
+    df = parsers.parse_endnote_xml(io.BytesIO(export))
+    assert df['id'].tolist() == ['EndNote_1', 'EndNote_2']
+    assert df.loc[0, 'title'].startswith('Diet') and df.loc[0, 'title'].endswith('exercise')
+    assert df.loc[0, 'authors'] == ['Smith, J']
+    assert df.loc[1, 'title'] == 'Second study'
+
+
+def test_parse_pubmed_text_joins_continuation_lines() -> None:
+    """Wrapped MEDLINE fields are joined without swallowing the next tag."""
+    nbib = (
+        b"PMID- 11111\nDP  - 2018 Mar\nTI  - A title that wraps\n      onto a second line.\n"
+        b"LID - 10.1000/abc [doi]\nAB  - Abstract text.\nFAU - Smith, John\nAU  - Smith J\n"
+        b"TA  - J Test\nMH  - Humans\n\nPMID- 22222\nTI  - Second\n"
+    )
+    df = parsers.parse_pubmed_text(io.BytesIO(nbib))
+    first = df.iloc[0]
+    assert first['title'] == 'A title that wraps onto a second line.'
+    assert (first['doi'], first['year'], first['authors'], first['mesh_terms']) == ('10.1000/abc', 2018, ['Smith, John'], ['Humans'])
+    assert list(df['id']) == ['PMID:11111', 'PMID:22222']
+
+
+@pytest.mark.parametrize('loader', ['bulk_insert_citations', 'bulk_insert_citations_fast'])
+def test_bulk_insert_upserts_existing_citations(loader: str) -> None:
+    """Re‑inserting an existing ID updates it instead of duplicating it."""
+    db.configure('sqlite:///:memory:')
+    db.init_db()
+    insert_citations = getattr(db, loader)
+    first = pd.DataFrame({'id': ['ID1', 'ID2'], 'title': ['Old title', 'Other'], 'year': [2020, 2021]})
+    assert insert_citations(first)['inserted'] == 2
+    second = pd.DataFrame({'id': ['ID1', 'ID3', ''], 'title': ['New title', 'Third', 'Skip'], 'year': [None, 2022, None]})
+    # one row per chunk exercises the batch boundaries
+    stats = insert_citations(second, chunk_size=1)
+    assert (stats['inserted'], stats['updated'], stats['skipped']) == (1, 1, 1)
+    citation = db.fetch_citation('ID1')
+    assert citation['title'] == 'New title'
+    # a missing year in the update keeps the stored year
+    assert citation['year'] == 2020
+    assert db.get_corpus_stats()['total_citations'] == 3
+
+
+@pytest.mark.parametrize('loader', ['bulk_insert_citations', 'bulk_insert_citations_fast'])
+def test_partial_reinsert_keeps_stored_fields(loader: str) -> None:
+    """Columns absent from a re‑inserted frame keep their stored values."""
+    db.configure('sqlite:///:memory:')
+    db.init_db()
+    insert_citations = getattr(db, loader)
+    insert_citations(pd.DataFrame({
+        'id': ['ID1'], 'title': ['Old title'], 'abstract': ['Stored abstract'], 'journal': ['BMJ'],
+        'doi': ['10.1/one'], 'authors': [['Smith, J']], 'keywords': [['trial']], 'raw_data': [{'source': 'ris'}],
+    }))
+    insert_citations(pd.DataFrame({'id': ['ID1'], 'title': ['New title']}))
+    citation = db.fetch_citation('ID1')
+    assert citation['title'] == 'New title'
+    assert (citation['abstract'], citation['journal'], citation['doi']) == ('Stored abstract', 'BMJ', '10.1/one')
+    assert (citation['authors'], citation['keywords'], citation['raw_data']) == (['Smith, J'], ['trial'], {'source': 'ris'})
+    assert db.list_search_results()[0]['url'] == 'https://doi.org/10.1/one'
+
+
+def test_search_full_text_index_tracks_updates() -> None:
+    """Search matches every query word and follows upserted abstracts."""
+    db.configure('sqlite:///:memory:')
+    db.init_db()
+    df = pd.DataFrame({
+        'id': ['PMID:1', 'PMID:2'],
+        'title': ['COVID-19 vaccination in children', 'Statin therapy'],
+        'abstract': ['A randomised trial of vaccines.', 'Cardiovascular outcomes in adults.'],
+    })
+    db.bulk_insert_citations(df)
+    assert [r['id'] for r in db.search_citations('covid-19 vaccine')] == ['PMID:1']
+    assert db.search_citations('statin children') == []
+    db.bulk_insert_citations(pd.DataFrame({'id': ['PMID:2'], 'title': ['Statin therapy'], 'abstract': ['Renal outcomes.']}))
+    assert db.search_citations('cardiovascular') == []
+    assert [r['id'] for r in db.search_citations('renal')] == ['PMID:2']
+    # snippets come from around the match, falling back to the title
+    long_abstract = ' '.join(['filler'] * 100) + ' nephrotoxicity was rare'
+    db.bulk_insert_citations(pd.DataFrame({
+        'id': ['PMID:3', 'PMID:4'], 'title': ['Aminoglycosides', 'Dosing'], 'abstract': [long_abstract, None],
+    }))
+    assert 'nephrotoxicity' in db.search_citations('nephrotoxicity')[0]['text']
+    assert db.search_citations('dosing')[0]['text'] == 'Dosing'
+
+
 def test_validation_and_quality_scoring() -> None:
     """Ensure the citation validator computes quality metrics correctly."""
     # Construct a DataFrame with a missing abstract
@@ -118,4 +230,212 @@ def test_ice_critic_analysis() -> None:
     # One high‑confidence exclusion should generate a low severity issue
     types = {issue['type'] for issue in analysis['issues']}
     assert 'high_confidence_exclusion' in types
-    assert analysis['summary']['total_issues'] >= 1
\ No newline at end of file
+    assert analysis['summary']['total_issues'] >= 1
+
+
+def test_find_similar_reasons_with_lsh_bucketing() -> None:
+    """Long reason lists group the same near‑duplicates as short ones."""
+    pair = ['wrong study population adults', 'the wrong study population in adults']
+    assert ice_critic.find_similar_reasons(pair) == [pair]
+    noise = [f'unrelated reason number {i} topic{i}' for i in range(100)]
+    groups = ice_critic.find_similar_reasons(noise[:50] + pair + noise[50:])
+    assert pair in groups
+
+
+@pytest.mark.skipif(not ice_critic.HAS_BITWISE_COUNT, reason='requires numpy.bitwise_count')
+def test_find_similar_reasons_bitset_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The bitset scorer groups reasons exactly like the set‑based one."""
+    reasons = ['wrong population', 'population wrong', '', 'not a trial', 'trial', '', 'wrong design']
+    expected = ice_critic.find_similar_reasons(reasons)
+    monkeypatch.setattr(ice_critic, 'HAS_NUMBA', False)
+    assert ice_critic.find_similar_reasons(reasons) == expected
+
+
+def test_screening_stream_yields_decisions_incrementally(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Streamed output text is decoded into decisions as each one completes."""
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    deep_research = importlib.import_module('full_stack_app.backend.deep_research')
+
+    class Event:
+        def __init__(self, delta: str) -> None:
+            self.type = 'response.output_text.delta'
+            self.delta = delta
+
+    text = '```json\n[{"id": "1", "decision": "Include", "reasoning": "a {braced} note"},\n {"id": "2", "decision": "Exclude"}]\n```'
+    seen = []
+
+    def events():
+        for start in range(0, len(text), 7):
+            yield Event(text[start:start + 7])
+            seen.append(start)
+
+    stream = deep_research.ScreeningStream(events())
+    decisions = []
+    for decision in stream:
+        decisions.append((decision['id'], len(seen)))
+    assert [d for d, _ in decisions] == ['1', '2']
+    # the first decision is available before the stream has finished
+    assert decisions[0][1] < len(range(0, len(text), 7)) - 1
+    assert stream.content == text
+
+
+def test_screening_stream_skips_bracketed_prose(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Brackets in text before the array do not hide the decisions."""
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    deep_research = importlib.import_module('full_stack_app.backend.deep_research')
+
+    class Event:
+        def __init__(self, delta: str) -> None:
+            self.type = 'response.output_text.delta'
+            self.delta = delta
+
+    text = 'I reviewed [12] citations [see notes]: [\n {"id": "1", "decision": "Include"}]'
+    stream = deep_research.ScreeningStream(Event(text[i:i + 4]) for i in range(0, len(text), 4))
+    assert [d['id'] for d in stream] == ['1']
+
+
+def test_wait_for_job_backs_off_until_complete(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Background jobs are re-fetched with doubling, capped delays."""
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    deep_research = importlib.import_module('full_stack_app.backend.deep_research')
+
+    class Response:
+        def __init__(self, status: str) -> None:
+            self.id = 'resp_1'
+            self.status = status
+
+    statuses = iter(['in_progress'] * 6 + ['completed'])
+    delays = []
+    monkeypatch.setattr(deep_research.time, 'sleep', delays.append)
+    monkeypatch.setattr(deep_research.client.responses, 'retrieve', lambda _id: Response(next(statuses)))
+    done = deep_research.wait_for_job(Response('queued'))
+    assert done.status == 'completed'
+    assert delays == [0.5, 1.0, 2.0, 4.0, 8.0, 10.0, 10.0]
+
+
+def test_streamed_csv_chunks_load_into_database() -> None:
+    """CSV uploads are parsed in chunks and loaded from an iterator of frames."""
+    db.configure('sqlite:///:memory:')
+    db.init_db()
+    rows = '\n'.join(f'ID{i},Title {i},2020,"A; B"' for i in range(5))
+    upload = io.BytesIO(f'PMID,Title,Year,Authors\n{rows}\nID0,Title 0 again,2021,C\n'.encode())
+    chunks = list(parsers.iter_parse_citations_batch([(upload, 'refs.csv')], chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 2]
+    assert chunks[0]['authors'].tolist() == [['A', 'B'], ['A', 'B']]
+    assert not upload.closed
+    stats = db.bulk_insert_citations_fast(iter(chunks))
+    assert (stats['total'], stats['inserted'], stats['updated']) == (6, 5, 1)
+    assert db.fetch_citation('ID0')['title'] == 'Title 0 again'
+    with db.engine.connect() as conn:
+        staged = conn.execute(text("SELECT name FROM sqlite_master WHERE name LIKE 'citations_stage%'")).all()
+    assert staged == []
+
+
+def test_corpus_version_changes_after_bulk_load() -> None:
+    """Each committed bulk load bumps the corpus version used for caching."""
+    db.configure('sqlite:///:memory:')
+    db.init_db()
+    before = db.get_corpus_version()
+    db.bulk_insert_citations(pd.DataFrame({'id': ['ID1'], 'title': ['A title']}))
+    middle = db.get_corpus_version()
+    db.bulk_insert_citations_fast(pd.DataFrame({'id': ['ID2'], 'title': ['B title']}))
+    assert before < middle < db.get_corpus_version()
+
+
+def test_fetch_citations_bulk_keeps_request_order() -> None:
+    """Bulk fetches return known citations once, in the order requested."""
+    db.configure('sqlite:///:memory:')
+    db.init_db()
+    db.bulk_insert_citations(pd.DataFrame({
+        'id': ['ID1', 'ID2', 'ID3'], 'title': ['One', 'Two', 'Three'], 'authors': [['A'], [], ['B', 'C']],
+    }))
+    citations = db.fetch_citations_bulk(['ID3', 'missing', 'ID1', 'ID3'])
+    assert [c['id'] for c in citations] == ['ID3', 'ID1']
+    assert citations[0] == db.fetch_citation('ID3')
+    assert db.fetch_citations_bulk([]) == []
+
+
+def test_validator_reset_clears_accumulated_stats() -> None:
+    """A reused validator reports each load on its own after ``reset``."""
+    validator = data_validator.CitationValidator()
+    df = pd.DataFrame({'id': [None], 'title': ['Tiny'], 'abstract': [''], 'year': [1700]})
+    validator.validate_citations(df)
+    validator.validate_citations(df)
+    assert validator.stats['total'] == 2
+    validator.reset()
+    _, report = validator.validate_citations(df)
+    assert report['summary']['total'] == 1
+    assert report['summary']['invalid_year'] == 1
+    assert len(report['problematic_citations']) == 1
+
+
+def test_listing_results_use_stored_urls_and_sql_snippets() -> None:
+    """URLs are computed on insert and snippets are truncated by the database."""
+    db.configure('sqlite:///:memory:')
+    db.init_db()
+    db.bulk_insert_citations_fast(pd.DataFrame({
+        'id': ['PMID:1', 'X2', 'X3'],
+        'title': ['One', 'Two', 'Three'],
+        'abstract': ['a' * 250, '', None],
+        'doi': [None, '10.1/two', None],
+    }))
+    results = {r['id']: r for r in db.list_search_results()}
+    assert results['PMID:1']['url'] == 'https://pubmed.ncbi.nlm.nih.gov/1/'
+    assert results['PMID:1']['text'] == 'a' * 200 + '...'
+    assert (results['X2']['url'], results['X2']['text']) == ('https://doi.org/10.1/two', 'Two')
+    assert (results['X3']['url'], results['X3']['text']) == ('', 'Three')
+    assert db.search_citations('two')[0]['url'] == 'https://doi.org/10.1/two'
+
+
+def test_empty_upload_loads_nothing() -> None:
+    """Uploads without any citations load cleanly with zero counts."""
+    db.configure('sqlite:///:memory:')
+    db.init_db()
+    uploads = [
+        (io.BytesIO(b'<?xml version="1.0"?>\n<PubmedArticleSet></PubmedArticleSet>'), 'empty.xml'),
+        (io.BytesIO(b'PMID,Title,Year\n'), 'empty.csv'),
+    ]
+    validator = data_validator.CitationValidator()
+    frames = [validator.validate_citations(chunk)[0] for chunk in parsers.iter_parse_citations_batch(uploads)]
+    for loader in (db.bulk_insert_citations, db.bulk_insert_citations_fast):
+        stats = loader(iter(frames))
+        assert (stats['total'], stats['inserted'], stats['updated']) == (0, 0, 0)
+    assert db.list_search_results() == []
+
+
+def test_validation_accepts_duplicate_index_labels() -> None:
+    """Frames concatenated without ``ignore_index`` validate row by row."""
+    chunk = pd.DataFrame({'id': ['', 'ID2'], 'title': ['A usable title', 'x'], 'year': [1800, 2020]})
+    validated, report = data_validator.CitationValidator().validate_citations(pd.concat([chunk, chunk]))
+    assert validated['id'].str.startswith('hash_').tolist() == [True, False, True, False]
+    assert 'abstract' not in validated.columns and 'doi' not in validated.columns
+    issues = [c['issues'] for c in report['problematic_citations']]
+    assert issues[0] == ['Missing or invalid ID', 'Missing or insufficient abstract', 'Invalid year: 1800']
+    assert issues[1] == ['Missing or too short title', 'Missing or insufficient abstract']
+    assert len(issues) == 4
+
+
+def test_term_column_migration_runs_once() -> None:
+    """Legacy comma-joined terms are converted on the first ``init_db`` only."""
+    db.configure('sqlite:///:memory:')
+    with db.engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE citations (id VARCHAR PRIMARY KEY, title TEXT NOT NULL, abstract TEXT, year INTEGER, "
+            "authors TEXT, journal VARCHAR, doi VARCHAR, mesh_terms TEXT, keywords TEXT, raw_data TEXT, "
+            "created_at DATETIME)"
+        ))
+        conn.execute(text(
+            "INSERT INTO citations (id, title, mesh_terms, keywords) VALUES ('ID1', 'One', 'A, B', '[Review] X, Y')"
+        ))
+    db.init_db()
+    with db.engine.begin() as conn:
+        assert conn.execute(text("SELECT mesh_terms FROM citations")).scalar_one() == '["A","B"]'
+        assert conn.execute(text("SELECT keywords FROM citations")).scalar_one() == '["[Review] X","Y"]'
+        conn.execute(text("UPDATE citations SET mesh_terms = 'C, D'"))
+    db.init_db()
+    with db.engine.connect() as conn:
+        assert conn.execute(text("SELECT mesh_terms FROM citations")).scalar_one() == 'C, D'
+    # legacy values left in place still decode
+    db._decode_list.cache_clear()
+    assert db.get_all_citations(fields=('mesh_terms',)) == [{'mesh_terms': ['C', 'D']}]
+    assert db._decode_list('[Review] X, Y') == ('[Review] X', 'Y')